@@ -0,0 +1,148 @@
+"""Load test for server.py.
+
+Replays the recorded Wordle states from wordle_states.json plus a few
+LoLdle boards against the service from many keep-alive connections and
+reports throughput and latency percentiles.
+
+    python server.py &
+    python benchmarks/service_load.py --connections 32 --duration 10
+
+    python benchmarks/service_load.py --spawn   # start a server for the run
+"""
+import argparse
+import http.client
+import json
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+
+BENCH_DIR = Path(__file__).parent
+STATES_PATH = BENCH_DIR / "wordle_states.json"
+
+LOLDLE_BOARDS = [
+    [],
+    [{"champion": "Warwick", "feedback": {
+        "gender": "correct", "positions": "partial", "species": "incorrect",
+        "resource": "correct", "range_types": "correct", "regions": "incorrect",
+        "release_year": "higher"}}],
+    [{"champion": "Ahri", "feedback": {
+        "gender": "incorrect", "positions": "incorrect", "species": "incorrect",
+        "resource": "correct", "range_types": "incorrect", "regions": "partial",
+        "release_year": "lower"}}],
+]
+
+
+def build_requests():
+    with open(STATES_PATH) as f:
+        states = json.load(f)['states']
+    requests = [("/wordle/suggest", json.dumps({"guesses": state['guesses']}).encode())
+                for state in states]
+    requests += [("/loldle/suggest", json.dumps({"guesses": board}).encode())
+                 for board in LOLDLE_BOARDS]
+    return requests
+
+
+def worker(host, port, requests, offset, stop, latencies, statuses):
+    conn = http.client.HTTPConnection(host, port, timeout=10)
+    i = offset
+    while not stop.is_set():
+        path, body = requests[i % len(requests)]
+        i += 1
+        start = time.perf_counter()
+        try:
+            conn.request("POST", path, body, {"Content-Type": "application/json"})
+            response = conn.getresponse()
+            response.read()
+            status = response.status
+            if response.getheader("Connection", "").lower() == "close":
+                conn.close()
+        except (OSError, http.client.HTTPException):
+            status = "error"
+            conn.close()
+        latencies.append(time.perf_counter() - start)
+        statuses[status] = statuses.get(status, 0) + 1
+    conn.close()
+
+
+def percentile(sorted_values, q):
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def wait_for_health(host, port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection(host, port, timeout=1)
+            conn.request("GET", "/health")
+            if conn.getresponse().status == 200:
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Server at {host}:{port} did not become healthy")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the solver service")
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    parser.add_argument("--spawn", action="store_true",
+                        help="start server.py for the duration of the run")
+    parser.add_argument("--workers", type=int, default=8, help="server workers with --spawn")
+    parser.add_argument("--queue", type=int, default=64, help="server queue with --spawn")
+    args = parser.parse_args()
+
+    url = urlparse(args.url)
+    host, port = url.hostname, url.port or 80
+
+    server = None
+    if args.spawn:
+        server = subprocess.Popen([
+            sys.executable, str(BENCH_DIR.parent / "server.py"), "--host", host,
+            "--port", str(port), "--workers", str(args.workers), "--queue", str(args.queue)
+        ])
+    try:
+        wait_for_health(host, port)
+        requests = build_requests()
+        stop = threading.Event()
+        results = [([], {}) for _ in range(args.connections)]
+        threads = [
+            threading.Thread(target=worker, args=(host, port, requests, i, stop, *results[i]))
+            for i in range(args.connections)
+        ]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        time.sleep(args.duration)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+
+    latencies = sorted(t for lat, _ in results for t in lat)
+    statuses = {}
+    for _, counts in results:
+        for status, n in counts.items():
+            statuses[status] = statuses.get(status, 0) + n
+
+    ok = statuses.get(200, 0)
+    print(f"{len(latencies)} requests in {elapsed:.1f}s over {args.connections} connections")
+    print(f"throughput  {ok / elapsed:,.0f} ok req/s  ({len(latencies) / elapsed:,.0f} total)")
+    if latencies:
+        print(f"latency ms  p50 {percentile(latencies, 0.50) * 1000:.2f}  "
+              f"p95 {percentile(latencies, 0.95) * 1000:.2f}  "
+              f"p99 {percentile(latencies, 0.99) * 1000:.2f}  "
+              f"max {latencies[-1] * 1000:.2f}  mean {statistics.fmean(latencies) * 1000:.2f}")
+    print("status      " + "  ".join(f"{k}: {v}" for k, v in sorted(statuses.items(), key=str)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""Micro-benchmarks for the Wordle solver core.
+
+Times constraint updates, candidate filtering and guess scoring over the
+recorded early/mid/late game states in wordle_states.json.
+
+    python benchmarks/wordle_bench.py                   # run and print
+    python benchmarks/wordle_bench.py --save main       # store as baseline "main"
+    python benchmarks/wordle_bench.py --compare main    # flag slowdowns vs "main"
+
+Baselines live in benchmarks/results/. A case is flagged when it is slower
+by more than --threshold and a Mann-Whitney U test on the per-run samples
+is significant at --alpha. Exits 1 if any case regressed.
+"""
+import argparse
+import json
+import math
+import statistics
+import sys
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).parent
+sys.path.append(str(BENCH_DIR.parent))
+
+from games.wordle import logic
+
+STATES_PATH = BENCH_DIR / "wordle_states.json"
+RESULTS_DIR = BENCH_DIR / "results"
+
+
+def load_states(path=STATES_PATH):
+    with open(path) as f:
+        return json.load(f)['states']
+
+
+def replay(guesses):
+    """Constraints after feeding every recorded tile through apply_status."""
+    constraints = logic.new_constraints()
+    for guess in guesses:
+        for col_idx, (letter, status) in enumerate(zip(guess['word'], guess['statuses'])):
+            logic.apply_status(constraints, letter, col_idx, status)
+    return constraints
+
+
+def build_cases(states):
+    """(name, callable) pairs; each callable does one unit of work."""
+    words = logic.load_words()
+    cases = []
+    for state in states:
+        constraints = replay(state['guesses'])
+        candidates = logic.filter_words(words, constraints)
+        prefix = f"{state['phase']}/{state['name']}"
+
+        if state['guesses']:
+            cases.append((f"update_constraints/{prefix}",
+                          lambda g=state['guesses']: replay(g)))
+        cases.append((f"filter/{prefix}",
+                      lambda c=constraints: logic.filter_words(words, c)))
+        if candidates:
+            cases.append((f"score/{prefix}",
+                          lambda c=candidates: logic.best_guess(c)))
+    return cases
+
+
+def measure(func, repeats, min_time):
+    """Per-call seconds for `repeats` runs, each looped to last >= min_time."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2
+
+    samples = [elapsed / number]
+    for _ in range(repeats - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+    return samples
+
+
+def mann_whitney_p(a, b):
+    """Two-sided p-value of the Mann-Whitney U test (normal approximation)."""
+    ranked = sorted([(x, 0) for x in a] + [(x, 1) for x in b])
+    ranks = [0.0] * len(ranked)
+    i = 0
+    while i < len(ranked):
+        j = i
+        while j + 1 < len(ranked) and ranked[j + 1][0] == ranked[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        i = j + 1
+
+    n1, n2 = len(a), len(b)
+    r1 = sum(rank for rank, (_, group) in zip(ranks, ranked) if group == 0)
+    u = r1 - n1 * (n1 + 1) / 2
+    mean = n1 * n2 / 2
+    sd = math.sqrt(n1 * n2 * (n1 + n2 + 1) / 12)
+    if sd == 0:
+        return 1.0
+    z = (abs(u - mean) - 0.5) / sd
+    return 2 * (1 - statistics.NormalDist().cdf(max(z, 0.0)))
+
+
+def run(cases, repeats, min_time, pattern=None):
+    results = {}
+    for name, func in cases:
+        if pattern and pattern not in name:
+            continue
+        samples = measure(func, repeats, min_time)
+        results[name] = samples
+        print(f"{name:<44}{statistics.median(samples) * 1e6:>12.1f} us"
+              f"  (min {min(samples) * 1e6:.1f})")
+    return results
+
+
+def compare(results, baseline, threshold, alpha):
+    regressions = []
+    print(f"\n{'case':<44}{'base us':>10}{'now us':>10}{'change':>9}{'p':>9}")
+    for name, samples in results.items():
+        if name not in baseline:
+            continue
+        base = baseline[name]
+        before, after = statistics.median(base), statistics.median(samples)
+        change = after / before - 1
+        p = mann_whitney_p(base, samples)
+        flag = ""
+        if change > threshold and p < alpha:
+            flag = "  SLOWER"
+            regressions.append(name)
+        elif change < -threshold and p < alpha:
+            flag = "  faster"
+        print(f"{name:<44}{before * 1e6:>10.1f}{after * 1e6:>10.1f}"
+              f"{change:>+9.1%}{p:>9.3f}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--save", metavar="NAME", help="store results as baseline NAME")
+    parser.add_argument("--compare", metavar="NAME", help="compare against baseline NAME")
+    parser.add_argument("-k", dest="pattern", help="only run cases containing this text")
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--min-time", type=float, default=0.01,
+                        help="seconds per run; fast cases are looped to reach it")
+    parser.add_argument("--threshold", type=float, default=0.05,
+                        help="relative slowdown that counts as a regression")
+    parser.add_argument("--alpha", type=float, default=0.01)
+    args = parser.parse_args()
+
+    results = run(build_cases(load_states()), args.repeats, args.min_time, args.pattern)
+
+    if args.save:
+        RESULTS_DIR.mkdir(exist_ok=True)
+        with open(RESULTS_DIR / f"{args.save}.json", 'w') as f:
+            json.dump({'python': sys.version, 'results': results}, f, indent=1)
+        print(f"\nSaved baseline '{args.save}'")
+
+    if args.compare:
+        with open(RESULTS_DIR / f"{args.compare}.json") as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.threshold, args.alpha)
+        if regressions:
+            print(f"\n{len(regressions)} case(s) significantly slower")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+"""Typed LoLdle champion table built from loldle_data.csv.
+
+The CSV comes straight out of "loldle data collector.js": the header has
+leading spaces, multi-valued cells are joined with ",  " and years are
+strings. build_dataset() normalises it into Champion records and pickles
+them to a versioned cache that is rebuilt whenever the CSV checksum
+changes. Run this file directly to force a rebuild.
+"""
+import csv
+import hashlib
+import pickle
+import sys
+from dataclasses import dataclass
+from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+
+CSV_PATH = Path(__file__).parent / "loldle_data.csv"
+CACHE_PATH = Path(__file__).parent / "loldle_data.cache"
+CACHE_VERSION = 1  # bump when Champion or the enums change shape
+
+
+class Gender(Enum):
+    FEMALE = "Female"
+    MALE = "Male"
+    OTHER = "Other"
+
+
+class Position(Enum):
+    TOP = "Top"
+    JUNGLE = "Jungle"
+    MIDDLE = "Middle"
+    BOTTOM = "Bottom"
+    SUPPORT = "Support"
+
+
+class Resource(Enum):
+    MANA = "Mana"
+    MANALESS = "Manaless"
+    ENERGY = "Energy"
+    FURY = "Fury"
+    RAGE = "Rage"
+    HEAT = "Heat"
+    FLOW = "Flow"
+    FEROCITY = "Ferocity"
+    COURAGE = "Courage"
+    GRIT = "Grit"
+    SHIELD = "Shield"
+    BLOODTHIRST = "Bloodthirst"
+    HEALTH_COSTS = "Health costs"
+
+
+class RangeType(Enum):
+    MELEE = "Melee"
+    RANGED = "Ranged"
+
+
+@dataclass(frozen=True)
+class Champion:
+    name: str
+    gender: Gender
+    positions: frozenset  # of Position
+    species: frozenset  # of str
+    resource: Resource
+    range_types: frozenset  # of RangeType, both for form-swapping champions
+    regions: frozenset  # of str
+    release_year: int
+
+
+class LoldleDataset:
+    def __init__(self, champions):
+        self.champions = tuple(champions)
+        self.by_name = {champ.name.upper(): champ for champ in self.champions}
+
+    def __len__(self):
+        return len(self.champions)
+
+    def __iter__(self):
+        return iter(self.champions)
+
+    def get(self, name):
+        return self.by_name.get(name.strip().upper())
+
+
+# CSV header (stripped) -> Champion field
+COLUMNS = {
+    'Champion Name': 'name',
+    'Gender': 'gender',
+    'Position(s)': 'positions',
+    'Species': 'species',
+    'Resource': 'resource',
+    'Range Type': 'range_types',
+    'Region(s)': 'regions',
+    'Release Year': 'release_year'
+}
+
+
+_shared_sets = {}
+
+
+def split_values(cell):
+    # Equal sets share one object so the pickle memo stores each only once
+    values = frozenset(sys.intern(v.strip()) for v in cell.split(",") if v.strip())
+    return _shared_sets.setdefault(values, values)
+
+
+def parse_row(row):
+    try:
+        return Champion(
+            name=row['name'].strip(),
+            gender=Gender(row['gender'].strip()),
+            positions=frozenset(map(Position, split_values(row['positions']))),
+            species=split_values(row['species']),
+            resource=Resource(row['resource'].strip()),
+            range_types=frozenset(map(RangeType, split_values(row['range_types']))),
+            regions=split_values(row['regions']),
+            release_year=int(row['release_year'])
+        )
+    except ValueError as e:
+        raise ValueError(f"Bad LoLdle row for {row.get('name', '?')!r}: {e}") from None
+
+
+def parse_csv(text):
+    reader = csv.reader(text.splitlines())
+    header = [COLUMNS[h.strip()] for h in next(reader)]
+    return [parse_row(dict(zip(header, values))) for values in reader if values]
+
+
+def build_dataset(csv_path=CSV_PATH, cache_path=CACHE_PATH):
+    """Parse the CSV and rewrite the cache. Returns the new dataset."""
+    raw = Path(csv_path).read_bytes()
+    champions = parse_csv(raw.decode("utf-8"))
+    with open(cache_path, 'wb') as f:
+        pickle.dump({
+            'version': CACHE_VERSION,
+            'checksum': hashlib.sha256(raw).hexdigest(),
+            'champions': champions
+        }, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return LoldleDataset(champions)
+
+
+def load_cached(csv_path=CSV_PATH, cache_path=CACHE_PATH):
+    """Dataset from the cache, rebuilding it if stale, missing or unreadable."""
+    checksum = hashlib.sha256(Path(csv_path).read_bytes()).hexdigest()
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = pickle.load(f)
+        if cached['version'] == CACHE_VERSION and cached['checksum'] == checksum:
+            return LoldleDataset(cached['champions'])
+    except (OSError, pickle.UnpicklingError, EOFError, KeyError, AttributeError, TypeError):
+        pass
+    return build_dataset(csv_path, cache_path)
+
+
+@lru_cache(maxsize=None)
+def load_dataset():
+    return load_cached()
+
+
+if __name__ == "__main__":
+    # Rebuild through the package module so pickled classes resolve on load
+    sys.path.append(str(Path(__file__).parent.parent.parent))
+    from games.LoLdle import dataset as packaged
+
+    rebuilt = packaged.build_dataset()
+    print(f"Built {len(rebuilt)} champions -> {packaged.CACHE_PATH.name}")
@@ -0,0 +1,107 @@
+"""LoLdle candidate filtering and guess scoring over the typed dataset.
+
+Feedback for one guess is a status per attribute:
+'correct' / 'partial' / 'incorrect' for the categorical and multi-valued
+attributes, and 'correct' / 'higher' / 'lower' for release year, where
+'higher' means the answer was released later than the guess.
+"""
+import math
+from collections import Counter
+from functools import lru_cache
+from games.LoLdle.dataset import load_dataset
+from games.wordle.logic import TOP_CANDIDATES
+
+ATTRIBUTES = ('gender', 'positions', 'species', 'resource', 'range_types', 'regions',
+              'release_year')
+SET_ATTRIBUTES = {'positions', 'species', 'range_types', 'regions'}
+
+# cell classes scraped from the page -> feedback status
+CELL_STATUS = {
+    'correct': 'correct',
+    'partial': 'partial',
+    'incorrect': 'incorrect',
+    'too-low': 'higher',
+    'too-high': 'lower'
+}
+STATUSES = {'correct', 'partial', 'incorrect'}
+YEAR_STATUSES = {'correct', 'higher', 'lower'}
+
+
+def compare(guess, answer):
+    """Feedback tuple LoLdle would show for `guess` when the answer is `answer`."""
+    statuses = []
+    for attr in ATTRIBUTES:
+        g, a = getattr(guess, attr), getattr(answer, attr)
+        if g == a:
+            statuses.append('correct')
+        elif attr == 'release_year':
+            statuses.append('higher' if a > g else 'lower')
+        elif attr in SET_ATTRIBUTES and g & a:
+            statuses.append('partial')
+        else:
+            statuses.append('incorrect')
+    return tuple(statuses)
+
+
+def normalize_feedback(feedback):
+    """Accept a dict keyed by attribute or a sequence in ATTRIBUTES order."""
+    if isinstance(feedback, dict):
+        feedback = [feedback[attr] for attr in ATTRIBUTES]
+    feedback = tuple(CELL_STATUS.get(status, status) for status in feedback)
+    if len(feedback) != len(ATTRIBUTES):
+        raise ValueError(f"Expected {len(ATTRIBUTES)} feedback values, got {len(feedback)}")
+    for attr, status in zip(ATTRIBUTES, feedback):
+        allowed = YEAR_STATUSES if attr == 'release_year' else STATUSES
+        if status not in allowed:
+            raise ValueError(f"Unknown {attr} status: {status}")
+    return feedback
+
+
+def filter_champions(candidates, guess, feedback):
+    return [champ for champ in candidates if compare(guess, champ) == feedback]
+
+
+def best_guess(candidates, pool):
+    """Guess from `pool` whose feedback splits `candidates` into the most even groups."""
+    if len(candidates) <= 2:
+        return candidates[0]
+
+    candidate_names = {champ.name for champ in candidates}
+
+    def score(guess):
+        counts = Counter(compare(guess, answer) for answer in candidates)
+        entropy = -sum(n / len(candidates) * math.log2(n / len(candidates))
+                       for n in counts.values())
+        # prefer guesses that could be the answer when information ties
+        return entropy + (0.01 if guess.name in candidate_names else 0)
+
+    return max(pool, key=score)
+
+
+@lru_cache(maxsize=4096)
+def _solve(history):
+    dataset = load_dataset()
+    candidates = list(dataset)
+    for name, feedback in history:
+        guess = dataset.get(name)
+        candidates = filter_champions(candidates, guess, feedback)
+    if not candidates:
+        return None, 0, ()
+    return (best_guess(candidates, dataset.champions).name, len(candidates),
+            tuple(c.name for c in candidates[:TOP_CANDIDATES]))
+
+
+def suggest(guesses):
+    """(suggestion, remaining, first candidate names) for [(champion name, feedback), ...].
+
+    Results are cached on the normalised guess history, so repeated boards
+    (everyone's opener, the same mid-game state on many accounts) are free.
+    """
+    dataset = load_dataset()
+    history = []
+    for name, feedback in guesses:
+        champ = dataset.get(name)
+        if champ is None:
+            raise ValueError(f"Unknown champion: {name}")
+        history.append((champ.name, normalize_feedback(feedback)))
+    return _solve(tuple(history))
@@ -9,12 +9,16 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from webdriver_manager.chrome import ChromeDriverManager
 from games.game_base import DailyGame
+from games.instrumentation import timed
+from games.LoLdle import logic
 
 class LoldleSolver(DailyGame):
     def __init__(self):
         self.driver = None
         self.service = None
         self.current_guesses = []
+        self.current_champions = []
+        self.current_results = []
         self.auto_update_var = tk.BooleanVar(value=True)
         self.init_chrome()
         self.update_thread = threading.Thread(target=self.auto_refresh, daemon=True)
@@ -79,12 +83,21 @@ class LoldleSolver(DailyGame):
             
             if game_state:
                 # Process and display the guesses
+                changed = game_state['guesses'] != self.current_guesses
                 self.current_guesses = game_state['guesses']
+                self.current_champions = game_state['champions']
+                self.current_results = game_state['results']
                 self.create_letter_grid(game_state['results'])
+                if changed:
+                    self.record_board(self.current_champions, game_state['results'], solved=any(
+                        result and all(res == 'correct' for res in result)
+                        for result in game_state['results']
+                    ))
                 
         except Exception as e:
             messagebox.showerror("Refresh Error", str(e))
 
+    @timed("get_game_state")
     def get_game_state(self):
         """
         Loldle stores game state in the HTML structure.
@@ -97,14 +110,19 @@ class LoldleSolver(DailyGame):
         """
         try:
             # Get all guess rows
+            self.stats.count("driver_calls")
             guess_rows = self.driver.find_elements(By.CLASS_NAME, "guess-row") #FIXME: This is not working
             
             guesses = []
+            champions = []
             results = []
             
             for row in guess_rows:
                 cells = row.find_elements(By.CLASS_NAME, "guess-cell")
-                guess = "".join([cell.text for cell in cells])
+                # find_elements, then .text and the class attribute per cell
+                self.stats.count("driver_calls", 1 + 2 * len(cells))
+                texts = [cell.text for cell in cells]
+                guess = "".join(texts)
                 result = []
                 
                 for cell in cells:
@@ -121,10 +139,12 @@ class LoldleSolver(DailyGame):
                         result.append('incorrect')
                 
                 guesses.append(guess)
+                champions.append(texts[0] if texts else "")  # first cell names the champion
                 results.append(result)
             
             return {
                 'guesses': guesses,
+                'champions': champions,
                 'results': results
             }
             
@@ -132,6 +152,7 @@ class LoldleSolver(DailyGame):
             messagebox.showerror("State Error", str(e))
             return None
 
+    @timed("create_letter_grid")
     def create_letter_grid(self, results):
         for widget in self.grid_frame.winfo_children():
             widget.destroy()
@@ -160,16 +181,31 @@ class LoldleSolver(DailyGame):
                     font=('Arial', 12)
                 )
                 label.grid(row=0, column=col_idx, padx=2)
+                self.stats.count("widgets_built")
 
     def get_suggestion(self):
         """Implementation of abstract method from DailyGame"""
         return self.suggest_next()
 
+    @timed("suggest_next")
     def suggest_next(self):
-        # TODO: Implement Loldle-specific suggestion logic
-        # This will require accessing champion data and filtering based on constraints
-        suggestion = "Implement suggestion logic"
-        self.status_label.config(text=f"Suggested: {suggestion}")
+        start = time.perf_counter()
+        # attribute cells are the last ones in each row, after the champion
+        history = [(champion, result[-len(logic.ATTRIBUTES):])
+                   for champion, result in zip(self.current_champions, self.current_results)]
+        try:
+            suggestion, remaining, _ = logic.suggest(history)
+        except ValueError as e:
+            self.status_label.config(text=str(e))
+            return None
+
+        if suggestion:
+            self.status_label.config(text=f"Suggested: {suggestion} ({remaining} champions left)")
+        else:
+            self.status_label.config(text="No champion matches the feedback!")
+        self.record_board(self.current_champions, self.current_results,
+                          [suggestion] if suggestion else [],
+                          (time.perf_counter() - start) * 1000)
         return suggestion
 
     def cleanup(self):
@@ -181,5 +217,7 @@ class LoldleSolver(DailyGame):
     def reset_constraints(self):
         #     Reset all constraints and force a fresh load from the game state.
         self.current_guesses = []
+        self.current_champions = []
+        self.current_results = []
         self.status_label.config(text="Reset complete - synced with current game state")
         self.force_refresh()
\ No newline at end of file
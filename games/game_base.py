@@ -1,7 +1,26 @@
 import tkinter as tk
 from abc import ABC, abstractmethod
+from games.instrumentation import Instrumentation
+from games.history import get_history
 
 class DailyGame(ABC):
+    @property
+    def stats(self):
+        """Per-game timing spans and counters, created on first use."""
+        if '_stats' not in self.__dict__:
+            self._stats = Instrumentation(type(self).__name__)
+        return self._stats
+
+    @property
+    def game_name(self):
+        return type(self).__name__.removesuffix("Solver").lower()
+
+    def record_board(self, guesses, feedback=(), suggestions=(), latency_ms=None, solved=False,
+                     aggregate=True):
+        """Append the board as currently seen to the local history store."""
+        get_history().record(self.game_name, guesses, feedback, suggestions, latency_ms, solved,
+                             aggregate=aggregate)
+
     @abstractmethod
     def create_ui(self, parent_frame):
         pass
@@ -0,0 +1,259 @@
+"""Local game history in SQLite.
+
+Every observed board is appended to `observations`; games with a win
+condition also fold it into one `daily` row per (game, player, date),
+which is what the analytics queries read, so they stay small and indexed
+no matter how long the raw log grows. Writes are queued and flushed in
+batches by a background thread so the Tk thread never waits on disk.
+"""
+import atexit
+import datetime
+import getpass
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+import tkinter as tk
+import traceback
+from contextlib import closing
+from pathlib import Path
+from tkinter import messagebox
+
+DB_PATH = Path(__file__).parent.parent / "history.sqlite3"
+BATCH_SIZE = 200
+FLUSH_INTERVAL = 0.5  # seconds a partial batch may wait
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS observations (
+    id INTEGER PRIMARY KEY,
+    recorded_at REAL NOT NULL,
+    date TEXT NOT NULL,
+    game TEXT NOT NULL,
+    player TEXT NOT NULL,
+    guesses TEXT NOT NULL,
+    feedback TEXT NOT NULL,
+    suggestions TEXT NOT NULL,
+    latency_ms REAL
+);
+CREATE INDEX IF NOT EXISTS observations_game_date ON observations (game, date);
+
+CREATE TABLE IF NOT EXISTS daily (
+    game TEXT NOT NULL,
+    player TEXT NOT NULL,
+    date TEXT NOT NULL,
+    num_guesses INTEGER NOT NULL,
+    solved INTEGER NOT NULL,
+    opener TEXT,
+    guesses TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (game, player, date)
+);
+CREATE INDEX IF NOT EXISTS daily_game_date ON daily (game, date);
+CREATE INDEX IF NOT EXISTS daily_game_opener ON daily (game, opener);
+"""
+
+
+def default_player():
+    return os.environ.get("DAILY_PLAYER") or getpass.getuser()
+
+
+class HistoryStore:
+    def __init__(self, path=DB_PATH):
+        self.path = str(path)
+        self.queue = queue.Queue()
+        with closing(self.connect()) as conn:
+            conn.executescript(SCHEMA)
+        self.writer = threading.Thread(target=self.write_loop, daemon=True)
+        self.writer.start()
+
+    def connect(self):
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def record(self, game, guesses, feedback=(), suggestions=(), latency_ms=None,
+               solved=False, player=None, date=None, aggregate=True):
+        """Queue one observed board. Returns immediately.
+
+        With `aggregate=False` the board is only logged to `observations`,
+        for games whose boards have no guess count or win to summarise.
+        Serialising here means a bad board fails in the caller instead of
+        taking the rest of its batch down with it.
+        """
+        guesses = list(guesses)
+        self.queue.put((
+            time.time(),
+            date or datetime.date.today().isoformat(),
+            game,
+            player or default_player(),
+            json.dumps(guesses),
+            json.dumps([list(row) for row in feedback]),
+            json.dumps(list(suggestions)),
+            latency_ms,
+            len(guesses),
+            str(guesses[0]) if guesses else None,
+            int(bool(solved)),
+            aggregate
+        ))
+
+    def write_loop(self):
+        conn = None
+        while True:
+            batch = [self.queue.get()]
+            deadline = time.monotonic() + FLUSH_INTERVAL
+            while len(batch) < BATCH_SIZE:
+                try:
+                    batch.append(self.queue.get(timeout=max(0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+            try:
+                conn = conn or self.connect()
+                self.write_batch(conn, batch)
+            except Exception as e:
+                # keep the writer alive so flush() and atexit never hang
+                report_error(e)
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+
+    def write_batch(self, conn, batch):
+        observations = []
+        daily = []
+        for (recorded_at, date, game, player, guesses, feedback, suggestions, latency,
+             num_guesses, opener, solved, aggregate) in batch:
+            observations.append((recorded_at, date, game, player, guesses, feedback,
+                                 suggestions, latency))
+            if aggregate:
+                daily.append((game, player, date, num_guesses, solved, opener, guesses,
+                              recorded_at))
+        with conn:
+            conn.executemany(
+                "INSERT INTO observations (recorded_at, date, game, player, guesses,"
+                " feedback, suggestions, latency_ms) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                observations
+            )
+            # Boards only grow during a day and a win is never undone, so
+            # a later record without the solved flag (a suggestion) or with
+            # fewer guesses (a fresh window) must not overwrite the day
+            conn.executemany(
+                "INSERT INTO daily (game, player, date, num_guesses, solved, opener,"
+                " guesses, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (game, player, date) DO UPDATE SET"
+                " guesses = CASE WHEN excluded.num_guesses >= daily.num_guesses"
+                " THEN excluded.guesses ELSE daily.guesses END,"
+                " num_guesses = MAX(daily.num_guesses, excluded.num_guesses),"
+                " solved = MAX(daily.solved, excluded.solved),"
+                " opener = COALESCE(daily.opener, excluded.opener),"
+                " updated_at = excluded.updated_at",
+                daily
+            )
+
+    def flush(self):
+        """Block until every queued board has been written."""
+        self.queue.join()
+
+    # Analytics
+
+    def query(self, sql, params=()):
+        self.flush()
+        with closing(self.connect()) as conn:
+            conn.row_factory = sqlite3.Row
+            return [dict(row) for row in conn.execute(sql, params)]
+
+    def summary(self, game, player=None):
+        """Days played, solve rate and average guesses on solved days."""
+        where, params = self._filter(game, player)
+        return self.query(
+            "SELECT COUNT(*) AS played, SUM(solved) AS solved,"
+            " AVG(CASE WHEN solved THEN num_guesses END) AS avg_guesses"
+            f" FROM daily WHERE {where}", params
+        )[0]
+
+    def guess_distribution(self, game, player=None):
+        where, params = self._filter(game, player)
+        rows = self.query(
+            "SELECT num_guesses, COUNT(*) AS days FROM daily"
+            f" WHERE {where} AND solved GROUP BY num_guesses ORDER BY num_guesses", params
+        )
+        return {row['num_guesses']: row['days'] for row in rows}
+
+    def opener_stats(self, game, player=None, min_days=1):
+        """Per first guess: days used, solve rate and average guesses when solved."""
+        where, params = self._filter(game, player)
+        return self.query(
+            "SELECT opener, COUNT(*) AS days, AVG(solved) AS solve_rate,"
+            " AVG(CASE WHEN solved THEN num_guesses END) AS avg_guesses"
+            f" FROM daily WHERE {where} AND opener IS NOT NULL"
+            " GROUP BY opener HAVING COUNT(*) >= ?"
+            " ORDER BY avg_guesses IS NULL, avg_guesses, days DESC",
+            params + (min_days,)
+        )
+
+    def streaks(self, game, player=None):
+        """Current and longest run of consecutive solved days for one player."""
+        player = player or default_player()
+        rows = self.query(
+            "SELECT date FROM daily WHERE game = ? AND player = ? AND solved ORDER BY date",
+            (game, player)
+        )
+        longest = current = 0
+        previous = None
+        for row in rows:
+            day = datetime.date.fromisoformat(row['date'])
+            current = current + 1 if previous and (day - previous).days == 1 else 1
+            longest = max(longest, current)
+            previous = day
+
+        # the current streak is only live if the last solve was today or yesterday
+        if previous is None or (datetime.date.today() - previous).days > 1:
+            current = 0
+        return {'current': current, 'longest': longest}
+
+    def latency(self, game):
+        """Suggestion latency over all recorded boards that showed a suggestion."""
+        return self.query(
+            "SELECT COUNT(latency_ms) AS samples, AVG(latency_ms) AS avg_ms,"
+            " MAX(latency_ms) AS max_ms FROM observations WHERE game = ?", (game,)
+        )[0]
+
+    @staticmethod
+    def _filter(game, player):
+        if player:
+            return "game = ? AND player = ?", (game, player)
+        return "game = ?", (game,)
+
+
+def report_error(e):
+    try:
+        messagebox.showerror("History Error", str(e))
+    except tk.TclError:  # no display, e.g. running the report below
+        traceback.print_exception(e)
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_history():
+    """Shared store so all games in the process use one writer thread."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = HistoryStore()
+            atexit.register(_store.flush)
+        return _store
+
+
+if __name__ == "__main__":
+    store = get_history()
+    games = [row['game'] for row in store.query("SELECT DISTINCT game FROM daily ORDER BY game")]
+    for game in games:
+        stats = store.summary(game)
+        print(f"{game}: {stats['played']} days, {stats['solved']} solved, "
+              f"avg {stats['avg_guesses'] or 0:.2f} guesses, streak {store.streaks(game)}")
+        for row in store.opener_stats(game)[:5]:
+            print(f"    {row['opener']:<12} {row['days']:>4} days  "
+                  f"avg {row['avg_guesses'] or 0:.2f}  solved {row['solve_rate']:.0%}")
@@ -0,0 +1,104 @@
+import csv
+import functools
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+SAMPLE_WINDOW = 500  # recent timings kept per span for percentiles
+
+
+class Instrumentation:
+    """Timing spans and counters for one game session.
+
+    Spans record call count, total/max time and a window of recent samples;
+    counters are plain integers. Safe to use from the auto-refresh thread.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.started = time.time()
+            self.spans = {}
+            self.counters = {}
+
+    @contextmanager
+    def span(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name, seconds):
+        with self.lock:
+            span = self.spans.get(name)
+            if span is None:
+                span = self.spans[name] = {
+                    'count': 0, 'total': 0.0, 'max': 0.0,
+                    'samples': deque(maxlen=SAMPLE_WINDOW)
+                }
+            span['count'] += 1
+            span['total'] += seconds
+            span['max'] = max(span['max'], seconds)
+            span['samples'].append(seconds)
+
+    def count(self, name, n=1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def snapshot(self):
+        """Plain-dict summary; times are in milliseconds."""
+        with self.lock:
+            spans = {}
+            for name, span in self.spans.items():
+                samples = sorted(span['samples'])
+                spans[name] = {
+                    'count': span['count'],
+                    'total_ms': span['total'] * 1000,
+                    'mean_ms': span['total'] * 1000 / span['count'],
+                    'p95_ms': samples[int(0.95 * (len(samples) - 1))] * 1000,
+                    'max_ms': span['max'] * 1000
+                }
+            return {
+                'game': self.name,
+                'started': self.started,
+                'elapsed_s': time.time() - self.started,
+                'spans': spans,
+                'counters': dict(self.counters)
+            }
+
+    def export(self, path):
+        """Write the snapshot as JSON, or as CSV rows if `path` ends in .csv."""
+        data = self.snapshot()
+        path = str(path)
+        if path.lower().endswith('.csv'):
+            with open(path, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(['game', 'kind', 'name', 'count', 'total_ms',
+                                 'mean_ms', 'p95_ms', 'max_ms'])
+                for name, span in data['spans'].items():
+                    writer.writerow([data['game'], 'span', name, span['count'],
+                                     f"{span['total_ms']:.3f}", f"{span['mean_ms']:.3f}",
+                                     f"{span['p95_ms']:.3f}", f"{span['max_ms']:.3f}"])
+                for name, value in data['counters'].items():
+                    writer.writerow([data['game'], 'counter', name, value, '', '', '', ''])
+        else:
+            with open(path, 'w') as f:
+                json.dump(data, f, indent=2)
+
+
+def timed(name):
+    """Method decorator recording a span on the instance's `stats`."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            with self.stats.span(name):
+                return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
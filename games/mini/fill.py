@@ -0,0 +1,212 @@
+from functools import lru_cache
+from pathlib import Path
+from games.wordle.logic import WORDS_PATH, load_words
+
+WORDS_PATHS = [
+    WORDS_PATH,  # five-letter words only
+    Path(__file__).parent / "words.txt",  # optional extra list for shorter slots
+]
+LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+BLOCK = '#'
+
+
+class WordIndex:
+    """Positional index over the word list, grouped by word length.
+
+    `bits[length][pos][letter]` is an int used as a bitset: bit k is set when
+    word k of that length has `letter` at `pos`. Crossing checks become
+    bitset intersections instead of scans over the word list.
+    """
+
+    def __init__(self, words=()):
+        all_words = sorted({word for word in words if word.isalpha() and word.isascii()})
+
+        self.words = {}
+        self.bits = {}
+        for word in all_words:
+            self.words.setdefault(len(word), []).append(word)
+
+        for length, words in self.words.items():
+            table = [dict.fromkeys(LETTERS, 0) for _ in range(length)]
+            for k, word in enumerate(words):
+                bit = 1 << k
+                for pos, letter in enumerate(word):
+                    table[pos][letter] |= bit
+            self.bits[length] = table
+
+    @classmethod
+    def from_files(cls, paths=WORDS_PATHS):
+        words = []
+        for path in paths:
+            if Path(path).exists():
+                words.extend(load_words(path))
+        return cls(words)
+
+    def full(self, length):
+        return (1 << len(self.words.get(length, []))) - 1
+
+    def letters_at(self, length, pos, domain):
+        """Letters that appear at `pos` in at least one word of `domain`."""
+        table = self.bits[length][pos]
+        return [letter for letter in LETTERS if domain & table[letter]]
+
+    def with_letters(self, length, pos, letters):
+        """Bitset of words having any of `letters` at `pos`."""
+        table = self.bits[length][pos]
+        mask = 0
+        for letter in letters:
+            mask |= table[letter]
+        return mask
+
+
+def iter_bits(mask):
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def find_slots(grid):
+    """Across and down runs of two or more open cells, as lists of (row, col)."""
+    rows, cols = len(grid), len(grid[0])
+    slots = []
+    for r in range(rows):
+        run = []
+        for c in range(cols + 1):
+            if c < cols and grid[r][c] != BLOCK:
+                run.append((r, c))
+            else:
+                if len(run) > 1:
+                    slots.append(run)
+                run = []
+    for c in range(cols):
+        run = []
+        for r in range(rows + 1):
+            if r < rows and grid[r][c] != BLOCK:
+                run.append((r, c))
+            else:
+                if len(run) > 1:
+                    slots.append(run)
+                run = []
+    return slots
+
+
+class CrosswordFill:
+    """Constraint-propagation search for fills of a partially lettered grid.
+
+    `grid` is a list of equal-length strings: letters are fixed, `#` is a
+    block and anything else ('.', ' ') is an open cell.
+    """
+
+    def __init__(self, grid, index):
+        self.grid = [row.upper() for row in grid]
+        self.index = index
+        self.slots = find_slots(self.grid)
+
+        # crossings[s] -> list of (pos in s, other slot, pos in other)
+        cell_slots = {}
+        for s, cells in enumerate(self.slots):
+            for pos, cell in enumerate(cells):
+                cell_slots.setdefault(cell, []).append((s, pos))
+        self.crossings = [[] for _ in self.slots]
+        for owners in cell_slots.values():
+            for s, pos in owners:
+                for t, other_pos in owners:
+                    if t != s:
+                        self.crossings[s].append((pos, t, other_pos))
+        # a word may fill only one slot, and only slots of its length can share it
+        self.same_length = [[t for t, other in enumerate(self.slots)
+                             if t != s and len(other) == len(cells)]
+                            for s, cells in enumerate(self.slots)]
+
+    def missing_lengths(self):
+        """Slot lengths the word list has no words for; such grids cannot fill."""
+        return sorted({len(cells) for cells in self.slots
+                       if not self.index.words.get(len(cells))})
+
+    def initial_domains(self):
+        domains = []
+        for cells in self.slots:
+            length = len(cells)
+            domain = self.index.full(length)
+            for pos, (r, c) in enumerate(cells):
+                letter = self.grid[r][c]
+                if letter in LETTERS:
+                    domain &= self.index.bits[length][pos][letter]
+            domains.append(domain)
+        return domains
+
+    def propagate(self, domains, queue):
+        """AC-3 over crossing cells. Returns False if any slot empties.
+
+        A slot narrowed to one word also removes that word from every other
+        slot, so branches that would repeat an entry are cut immediately.
+        """
+        queue = list(queue)
+        while queue:
+            s = queue.pop()
+            length = len(self.slots[s])
+            if not domains[s] & (domains[s] - 1):
+                for t in self.same_length[s]:
+                    if domains[t] & domains[s]:
+                        domains[t] &= ~domains[s]
+                        if not domains[t]:
+                            return False
+                        queue.append(t)
+            for pos, t, other_pos in self.crossings[s]:
+                letters = self.index.letters_at(length, pos, domains[s])
+                narrowed = domains[t] & self.index.with_letters(
+                    len(self.slots[t]), other_pos, letters
+                )
+                if narrowed != domains[t]:
+                    if not narrowed:
+                        return False
+                    domains[t] = narrowed
+                    queue.append(t)
+        return True
+
+    def solve(self, limit=None):
+        """Yield fills as lists of row strings, at most `limit` of them."""
+        if not self.slots:
+            return
+        if self.missing_lengths():
+            return
+        domains = self.initial_domains()
+        if not all(domains) or not self.propagate(domains, range(len(self.slots))):
+            return
+
+        found = 0
+        for domains in self._search(domains):
+            yield self.render(domains)
+            found += 1
+            if limit is not None and found >= limit:
+                return
+
+    def _search(self, domains):
+        open_slots = [s for s, d in enumerate(domains) if d & (d - 1)]
+        if not open_slots:
+            yield domains  # propagate already ruled out repeated entries
+            return
+
+        # most constrained slot first
+        s = min(open_slots, key=lambda i: domains[i].bit_count())
+        for k in iter_bits(domains[s]):
+            trial = list(domains)
+            trial[s] = 1 << k
+            if self.propagate(trial, [s]):
+                yield from self._search(trial)
+
+    def word(self, s, domain):
+        return self.index.words[len(self.slots[s])][domain.bit_length() - 1]
+
+    def render(self, domains):
+        rows = [list(row) for row in self.grid]
+        for s, cells in enumerate(self.slots):
+            for (r, c), letter in zip(cells, self.word(s, domains[s])):
+                rows[r][c] = letter
+        return ["".join(row) for row in rows]
+
+
+@lru_cache(maxsize=None)
+def get_index():
+    return WordIndex.from_files()
@@ -0,0 +1,138 @@
+import time
+import tkinter as tk
+from tkinter import ttk
+from games.game_base import DailyGame
+from games.instrumentation import timed
+from games.mini.fill import get_index, CrosswordFill, BLOCK
+
+GRID_SIZE = 5
+MAX_FILLS = 50
+
+class MiniSolver(DailyGame):
+    """Mini Crossword fill helper.
+
+    Known letters are typed into the 5x5 grid (`#` marks a black square)
+    and the solver lists fills consistent with every crossing.
+    """
+
+    def __init__(self):
+        self.index = get_index()
+        self.cell_vars = [[tk.StringVar(value="") for _ in range(GRID_SIZE)]
+                          for _ in range(GRID_SIZE)]
+        self.fills = []
+        self.fill_idx = 0
+
+    def create_ui(self, parent_frame):
+        main_frame = ttk.Frame(parent_frame)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        # Control Panel
+        control_frame = ttk.Frame(main_frame)
+        control_frame.pack(pady=10)
+
+        ttk.Button(control_frame, text="Find Fills",
+                  command=self.suggest_next).pack(side=tk.LEFT, padx=5)
+        ttk.Button(control_frame, text="Next Fill",
+                  command=self.next_fill).pack(side=tk.LEFT, padx=5)
+        ttk.Button(control_frame, text="Reset",
+                  command=self.reset_constraints).pack(side=tk.LEFT, padx=5)
+
+        # Input grid and fill display side by side
+        boards_frame = ttk.Frame(main_frame)
+        boards_frame.pack(pady=10)
+
+        input_frame = ttk.Frame(boards_frame)
+        input_frame.pack(side=tk.LEFT, padx=10)
+        for r in range(GRID_SIZE):
+            for c in range(GRID_SIZE):
+                ttk.Entry(input_frame, textvariable=self.cell_vars[r][c], width=3,
+                          justify=tk.CENTER).grid(row=r, column=c, padx=1, pady=1)
+
+        self.grid_frame = ttk.Frame(boards_frame)
+        self.grid_frame.pack(side=tk.LEFT, padx=10)
+
+        # Status Display
+        self.status_label = ttk.Label(main_frame, text="")
+        self.status_label.pack(pady=10)
+
+        return main_frame
+
+    def read_grid(self):
+        rows = []
+        for r in range(GRID_SIZE):
+            row = ""
+            for c in range(GRID_SIZE):
+                value = self.cell_vars[r][c].get().strip().upper()[:1]
+                row += value if value.isalpha() or value == BLOCK else '.'
+            rows.append(row)
+        return rows
+
+    @timed("create_letter_grid")
+    def update_grid(self):
+        for widget in self.grid_frame.winfo_children():
+            widget.destroy()
+        if not self.fills:
+            return
+
+        known = self.read_grid()
+        fill = self.fills[self.fill_idx]
+        for r, row in enumerate(fill):
+            for c, letter in enumerate(row):
+                if letter == BLOCK:
+                    bg_color = 'black'
+                elif known[r][c] == letter:
+                    bg_color = '#6aaa64'  # given letter
+                else:
+                    bg_color = 'white'
+                tk.Label(self.grid_frame, text="" if letter == BLOCK else letter,
+                         width=3, bg=bg_color, fg='black',
+                         font=('Arial', 12)).grid(row=r, column=c, padx=1, pady=1)
+                self.stats.count("widgets_built")
+
+    def get_suggestion(self):
+        """Implementation of abstract method from DailyGame"""
+        return self.suggest_next()
+
+    @timed("suggest_next")
+    def suggest_next(self):
+        start = time.perf_counter()
+        grid = self.read_grid()
+        solver = CrosswordFill(grid, self.index)
+        self.fills = list(solver.solve(limit=MAX_FILLS))
+        self.fill_idx = 0
+        self.update_grid()
+        self.record_board(grid, suggestions=["/".join(fill) for fill in self.fills[:1]],
+                          latency_ms=(time.perf_counter() - start) * 1000,
+                          aggregate=False)
+
+        missing = solver.missing_lengths()
+        if missing:
+            lengths = ", ".join(str(n) for n in missing)
+            self.status_label.config(
+                text=f"No {lengths}-letter words loaded; add them to games/mini/words.txt")
+            return None
+        if not self.fills:
+            self.status_label.config(text="No valid fill found!")
+            return None
+        more = "+" if len(self.fills) == MAX_FILLS else ""
+        self.status_label.config(text=f"Fill 1 of {len(self.fills)}{more}")
+        return self.fills[0]
+
+    def next_fill(self):
+        if not self.fills:
+            return
+        self.fill_idx = (self.fill_idx + 1) % len(self.fills)
+        self.update_grid()
+        self.status_label.config(text=f"Fill {self.fill_idx + 1} of {len(self.fills)}")
+
+    def reset_constraints(self):
+        for row in self.cell_vars:
+            for var in row:
+                var.set("")
+        self.fills = []
+        self.fill_idx = 0
+        self.update_grid()
+        self.status_label.config(text="Reset complete")
+
+    def cleanup(self):
+        pass
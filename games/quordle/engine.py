@@ -0,0 +1,139 @@
+import numpy as np
+from functools import lru_cache
+from games.wordle.logic import load_words
+
+ALL_GREEN = 242  # 3**5 - 1, every tile green
+NUM_PATTERNS = 243
+DEFAULT_OPENER = "TARES"
+
+# Scoring budget: guesses x answers pairs evaluated per suggestion
+PAIR_BUDGET = 1_500_000
+SAMPLE_LIMIT = 400  # max answers per board used to estimate entropy
+CHUNK_PAIRS = 400_000  # pairs per vectorized pattern batch
+
+
+class PatternEngine:
+    """Vectorized Wordle feedback over the shared word list.
+
+    Words are held as an (N, 5) uint8 letter array so feedback for a whole
+    batch of guesses against a whole candidate set is computed with numpy
+    broadcasting. Patterns are encoded base 3 (0 gray, 1 yellow, 2 green)
+    with position 0 as the lowest digit.
+    """
+
+    def __init__(self, words=None):
+        self.words = list(words) if words is not None else load_words()
+        self.index = {word: i for i, word in enumerate(self.words)}
+        self.letters = np.frombuffer(
+            "".join(self.words).encode("ascii"), dtype=np.uint8
+        ).reshape(-1, 5) - ord("A")
+
+    def __len__(self):
+        return len(self.words)
+
+    def patterns(self, guess_idx, answer_idx):
+        """Return a (len(guess_idx), len(answer_idx)) uint8 matrix of pattern codes."""
+        guess_idx = np.asarray(guess_idx, dtype=np.intp)
+        answer_idx = np.asarray(answer_idx, dtype=np.intp)
+        out = np.empty((len(guess_idx), len(answer_idx)), dtype=np.uint8)
+        if out.size == 0:
+            return out
+
+        step = max(1, CHUNK_PAIRS // max(1, len(answer_idx)))
+        answers = self.letters[answer_idx]
+        for start in range(0, len(guess_idx), step):
+            guesses = self.letters[guess_idx[start:start + step]]
+            out[start:start + step] = self._pattern_block(guesses, answers)
+        return out
+
+    @staticmethod
+    def _pattern_block(guesses, answers):
+        g = guesses[:, None, :]  # (G, 1, 5)
+        a = answers[None, :, :]  # (1, A, 5)
+        green = g == a  # (G, A, 5)
+
+        # same[g, a, i, k]: guess letter i equals answer letter k
+        same = guesses[:, None, :, None] == answers[None, :, None, :]
+        # letters of the answer left over for yellows after greens are taken
+        supply = (same & ~green[:, :, None, :]).sum(axis=3)
+
+        # earlier non-green occurrences of the same letter in the guess
+        # claim yellows first, left to right
+        guess_same = guesses[:, :, None] == guesses[:, None, :]  # (G, i, j)
+        earlier = np.tril(guess_same, k=-1)
+        rank = (earlier[:, None, :, :] & ~green[:, :, None, :]).sum(axis=3)
+
+        yellow = ~green & (rank < supply)
+        digits = green.astype(np.uint8) * 2 + yellow
+        return (digits * np.array([1, 3, 9, 27, 81], dtype=np.uint8)).sum(
+            axis=2, dtype=np.uint8
+        )
+
+    @staticmethod
+    def pattern_code(colors):
+        """Encode a list of 'absent'/'present'/'correct' statuses."""
+        value = {'absent': 0, 'present': 1, 'correct': 2}
+        return sum(value[status] * 3 ** i for i, status in enumerate(colors))
+
+    def filter(self, candidates, guess, code):
+        """Keep the candidates consistent with `guess` scoring `code`."""
+        if len(candidates) == 0:
+            return candidates
+        codes = self.patterns([self.index[guess]], candidates)[0]
+        return candidates[codes == code]
+
+    def entropy(self, guess_idx, answer_idx):
+        """Expected information (bits) of every guess against one candidate set."""
+        codes = self.patterns(guess_idx, answer_idx).astype(np.intp)
+        rows = np.arange(len(guess_idx))[:, None] * NUM_PATTERNS
+        counts = np.bincount(
+            (codes + rows).ravel(), minlength=len(guess_idx) * NUM_PATTERNS
+        ).reshape(len(guess_idx), NUM_PATTERNS)
+        p = counts / len(answer_idx)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return -np.nansum(p * np.log2(p), axis=1)
+
+    @staticmethod
+    def sample(candidates, rng, limit=SAMPLE_LIMIT):
+        if len(candidates) <= limit:
+            return candidates
+        return np.sort(rng.choice(candidates, size=limit, replace=False))
+
+    def best_joint_guess(self, boards):
+        """Pick the guess with the highest summed entropy over unsolved boards.
+
+        `boards` is a list of candidate index arrays, one per unsolved board.
+        """
+        boards = [b for b in boards if len(b)]
+        if not boards:
+            return None
+
+        # A board with one candidate left is a free solve
+        for candidates in boards:
+            if len(candidates) == 1:
+                return self.words[candidates[0]]
+
+        if all(len(b) == len(self) for b in boards) and DEFAULT_OPENER in self.index:
+            return DEFAULT_OPENER
+
+        # fresh fixed-seed generator so the same boards always get the same guess
+        rng = np.random.default_rng(0)
+        samples = [self.sample(b, rng) for b in boards]
+        answers = sum(len(s) for s in samples)
+        if len(self) * answers <= PAIR_BUDGET:
+            pool = np.arange(len(self))
+        else:
+            pool = np.unique(np.concatenate(boards))
+            pool = self.sample(pool, rng, max(1, PAIR_BUDGET // answers))
+
+        score = np.zeros(len(pool))
+        for candidates, sample in zip(boards, samples):
+            score += self.entropy(pool, sample)
+            # small bonus for guesses that could solve this board outright
+            score += np.isin(pool, candidates) / len(candidates)
+        return self.words[pool[int(np.argmax(score))]]
+
+
+@lru_cache(maxsize=None)
+def get_engine():
+    return PatternEngine()
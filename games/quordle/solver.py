@@ -0,0 +1,179 @@
+import time
+import tkinter as tk
+from tkinter import ttk, messagebox
+import numpy as np
+from games.game_base import DailyGame
+from games.instrumentation import timed
+from games.quordle.engine import get_engine, ALL_GREEN
+from games.wordle.logic import COLOR_STATUS
+
+VARIANTS = {
+    'Dordle (2)': 2,
+    'Quordle (4)': 4,
+    'Octordle (8)': 8
+}
+
+class QuordleSolver(DailyGame):
+    """Multi-board Wordle: one guess stream played on N boards at once.
+
+    Guesses are typed in and each board's tiles are colored by clicking,
+    as in the Wordle solver. Every board keeps its own candidate set and
+    suggestions are scored jointly across all unsolved boards.
+    """
+
+    def __init__(self):
+        self.engine = get_engine()
+        self.num_boards = 4
+        self.current_guesses = []
+        self.color_states = {}  # (board, row, col) -> color, non-gray only
+        self.variant_var = tk.StringVar(value='Quordle (4)')
+        self.guess_var = tk.StringVar(value="")
+
+    def create_ui(self, parent_frame):
+        main_frame = ttk.Frame(parent_frame)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        # Control Panel
+        control_frame = ttk.Frame(main_frame)
+        control_frame.pack(pady=10)
+
+        variant_box = ttk.Combobox(control_frame, textvariable=self.variant_var,
+                                   values=list(VARIANTS), state="readonly", width=12)
+        variant_box.pack(side=tk.LEFT, padx=5)
+        variant_box.bind("<<ComboboxSelected>>", self.change_variant)
+
+        guess_entry = ttk.Entry(control_frame, textvariable=self.guess_var, width=8)
+        guess_entry.pack(side=tk.LEFT, padx=5)
+        guess_entry.bind("<Return>", lambda event: self.add_guess())
+
+        ttk.Button(control_frame, text="Add Guess",
+                  command=self.add_guess).pack(side=tk.LEFT, padx=5)
+        ttk.Button(control_frame, text="Suggest Next",
+                  command=self.suggest_next).pack(side=tk.LEFT, padx=5)
+        ttk.Button(control_frame, text="Reset",
+                  command=self.reset_constraints).pack(side=tk.LEFT, padx=5)
+
+        # Boards Display
+        self.grid_frame = ttk.Frame(main_frame)
+        self.grid_frame.pack(pady=10)
+
+        # Status Display
+        self.status_label = ttk.Label(main_frame, text="")
+        self.status_label.pack(pady=10)
+
+        return main_frame
+
+    def change_variant(self, event=None):
+        self.num_boards = VARIANTS[self.variant_var.get()]
+        self.reset_constraints()
+
+    def add_guess(self):
+        guess = self.guess_var.get().strip().upper()
+        if guess not in self.engine.index:
+            messagebox.showerror("Invalid Guess", f"{guess or 'Empty guess'} is not in the word list")
+            return
+        self.current_guesses.append(guess)
+        self.guess_var.set("")
+        self.update_grid()
+
+    def update_grid(self):
+        self.create_letter_grid()
+        self.status_label.config(text="Candidates: " + " | ".join(
+            "solved" if c is None else str(len(c)) for c in self.board_candidates()
+        ))
+
+    @timed("create_letter_grid")
+    def create_letter_grid(self):
+        for widget in self.grid_frame.winfo_children():
+            widget.destroy()
+
+        self.letter_buttons = {}
+        per_row = 2 if self.num_boards <= 4 else 4
+        for board in range(self.num_boards):
+            board_frame = ttk.LabelFrame(self.grid_frame, text=f"Board {board + 1}")
+            board_frame.grid(row=board // per_row, column=board % per_row, padx=5, pady=5)
+
+            for row_idx, guess in enumerate(self.current_guesses):
+                for col_idx, letter in enumerate(guess):
+                    bg_color = self.color_states.get((board, row_idx, col_idx), '#787c7e')
+                    btn = tk.Button(
+                        board_frame,
+                        text=letter,
+                        width=2,
+                        bg=bg_color,
+                        fg='white' if bg_color == '#787c7e' else 'black',
+                        command=lambda b=board, r=row_idx, c=col_idx: self.cycle_color(b, r, c)
+                    )
+                    btn.grid(row=row_idx, column=col_idx, padx=1, pady=1)
+                    self.letter_buttons[(board, row_idx, col_idx)] = btn
+                    self.stats.count("widgets_built")
+
+                if self.row_code(board, row_idx) == ALL_GREEN:
+                    break  # board solved, later guesses don't apply
+
+    def cycle_color(self, board, row_idx, col_idx):
+        colors = ['#787c7e', '#c9b458', '#6aaa64']
+        current_color = self.color_states.get((board, row_idx, col_idx), '#787c7e')
+        next_color = colors[(colors.index(current_color) + 1) % len(colors)]
+
+        if next_color == '#787c7e':
+            self.color_states.pop((board, row_idx, col_idx), None)
+        else:
+            self.color_states[(board, row_idx, col_idx)] = next_color
+
+        self.update_grid()
+
+    def row_code(self, board, row_idx):
+        return self.engine.pattern_code([
+            COLOR_STATUS[self.color_states.get((board, row_idx, col), '#787c7e')]
+            for col in range(5)
+        ])
+
+    def board_candidates(self):
+        """Candidate index arrays per board, None for boards already solved."""
+        boards = []
+        for board in range(self.num_boards):
+            candidates = np.arange(len(self.engine))
+            for row_idx, guess in enumerate(self.current_guesses):
+                code = self.row_code(board, row_idx)
+                if code == ALL_GREEN:
+                    candidates = None
+                    break
+                candidates = self.engine.filter(candidates, guess, code)
+            boards.append(candidates)
+        return boards
+
+    def get_suggestion(self):
+        """Implementation of abstract method from DailyGame"""
+        return self.suggest_next()
+
+    @timed("suggest_next")
+    def suggest_next(self):
+        start = time.perf_counter()
+        boards = [c for c in self.board_candidates() if c is not None]
+        suggestion = None
+        if not boards:
+            self.status_label.config(text="All boards solved!")
+        elif any(len(c) == 0 for c in boards):
+            self.status_label.config(text="No valid words found!")
+        else:
+            suggestion = self.engine.best_joint_guess(boards)
+            self.status_label.config(text=f"Suggested: {suggestion}")
+
+        # feedback row per guess: one pattern code per board
+        feedback = [[self.row_code(board, row_idx) for board in range(self.num_boards)]
+                    for row_idx in range(len(self.current_guesses))]
+        self.record_board(self.current_guesses, feedback,
+                          [suggestion] if suggestion else [],
+                          (time.perf_counter() - start) * 1000,
+                          solved=not boards)
+        return suggestion
+
+    def reset_constraints(self):
+        self.current_guesses = []
+        self.color_states.clear()
+        self.update_grid()
+        self.status_label.config(text="Reset complete")
+
+    def cleanup(self):
+        pass
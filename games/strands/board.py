@@ -0,0 +1,181 @@
+from array import array
+from functools import lru_cache
+from pathlib import Path
+from games.wordle.logic import WORDS_PATH, load_words
+
+WORDS_PATHS = [
+    WORDS_PATH,
+    Path(__file__).parent / "words.txt",  # optional extra list, one word per line
+]
+MIN_WORD_LENGTH = 4
+
+
+class Trie:
+    """Prefix trie stored in flat arrays.
+
+    Node n's child for letter k lives at `children[n * 26 + k]` (0 means no
+    child; node 0 is the root so it is never a child). `terminal[n]` marks
+    the end of a word.
+    """
+
+    def __init__(self, words=()):
+        self.children = array('i', [0] * 26)
+        self.terminal = bytearray(1)
+        for word in words:
+            self.add(word)
+
+    @classmethod
+    def from_files(cls, paths=WORDS_PATHS):
+        trie = cls()
+        for path in paths:
+            if not Path(path).exists():
+                continue
+            for word in load_words(path):
+                if len(word) >= MIN_WORD_LENGTH and word.isalpha() and word.isascii():
+                    trie.add(word)
+        return trie
+
+    def add(self, word):
+        node = 0
+        for letter in word:
+            slot = node * 26 + ord(letter) - 65
+            child = self.children[slot]
+            if not child:
+                child = len(self.terminal)
+                self.children.extend([0] * 26)
+                self.terminal.append(0)
+                self.children[slot] = child
+            node = child
+        self.terminal[node] = 1
+
+    def __len__(self):
+        return len(self.terminal)
+
+
+class StrandsBoard:
+    """Letter grid with bitboard word search and exact-tiling search.
+
+    Cells are numbered row-major and a set of cells is an int bitmask, so
+    "already visited" and "overlaps another word" are single AND checks.
+    """
+
+    def __init__(self, rows, trie):
+        self.rows = [row.strip().upper() for row in rows if row.strip()]
+        self.height = len(self.rows)
+        self.width = len(self.rows[0]) if self.rows else 0
+        if any(len(row) != self.width for row in self.rows):
+            raise ValueError("All grid rows must be the same length")
+        if not all(row.isalpha() and row.isascii() for row in self.rows):
+            raise ValueError("Grid rows may only contain letters A-Z")
+
+        self.trie = trie
+        self.letters = [ord(ch) - 65 for row in self.rows for ch in row]
+        self.size = len(self.letters)
+        self.full_mask = (1 << self.size) - 1
+        self.neighbors = [self._neighbors(cell) for cell in range(self.size)]
+
+    def _neighbors(self, cell):
+        r, c = divmod(cell, self.width)
+        return [
+            nr * self.width + nc
+            for nr in range(r - 1, r + 2)
+            for nc in range(c - 1, c + 2)
+            if (nr, nc) != (r, c) and 0 <= nr < self.height and 0 <= nc < self.width
+        ]
+
+    def find_words(self):
+        """Return {word: [cell mask, ...]} for every traceable dictionary word."""
+        found = {}
+        children, terminal = self.trie.children, self.trie.terminal
+        letters, neighbors = self.letters, self.neighbors
+
+        def dfs(cell, node, visited, path):
+            if terminal[node] and len(path) >= MIN_WORD_LENGTH:
+                word = "".join(chr(letters[i] + 65) for i in path)
+                masks = found.setdefault(word, [])
+                if visited not in masks:
+                    masks.append(visited)
+            for nxt in neighbors[cell]:
+                bit = 1 << nxt
+                if visited & bit:
+                    continue
+                child = children[node * 26 + letters[nxt]]
+                if child:  # prefix pruning
+                    path.append(nxt)
+                    dfs(nxt, child, visited | bit, path)
+                    path.pop()
+
+        for cell in range(self.size):
+            node = children[self.letters[cell]]
+            if node:
+                dfs(cell, node, 1 << cell, [cell])
+        return found
+
+    def is_spangram(self, mask):
+        """True if the cells touch two opposite sides of the board."""
+        column = sum(1 << (r * self.width) for r in range(self.height))
+        row = (1 << self.width) - 1
+        left, right = column, column << (self.width - 1)
+        top, bottom = row, row << (self.width * (self.height - 1))
+        return bool((mask & left and mask & right) or (mask & top and mask & bottom))
+
+    def tile(self, words=None, limit=1):
+        """Yield lists of (word, mask) that cover every cell exactly once.
+
+        Exact cover by bitmask: always branch on the open cell with the
+        fewest usable placements, and remember covered-masks that are known
+        dead ends.
+        """
+        if words is None:
+            words = self.find_words()
+
+        by_cell = [[] for _ in range(self.size)]
+        for word, masks in words.items():
+            for mask in masks:
+                for cell in range(self.size):
+                    if mask >> cell & 1:
+                        by_cell[cell].append((word, mask))
+
+        dead = set()
+        chosen = []
+
+        def search(covered):
+            if covered == self.full_mask:
+                yield list(chosen)
+                return
+            if covered in dead:
+                return
+
+            best = None
+            for cell in range(self.size):
+                if covered >> cell & 1:
+                    continue
+                options = [(w, m) for w, m in by_cell[cell] if not m & covered]
+                if best is None or len(options) < len(best):
+                    best = options
+                    if len(best) <= 1:
+                        break
+
+            alive = False
+            for word, mask in best:
+                chosen.append((word, mask))
+                for solution in search(covered | mask):
+                    alive = True
+                    yield solution
+                chosen.pop()
+            if not alive:
+                dead.add(covered)
+
+        found = 0
+        for solution in search(0):
+            if len({word for word, _ in solution}) < len(solution):
+                continue  # a theme word is never used twice
+            yield solution
+            found += 1
+            if limit is not None and found >= limit:
+                return
+
+
+@lru_cache(maxsize=None)
+def get_trie():
+    return Trie.from_files()
@@ -0,0 +1,132 @@
+import time
+import tkinter as tk
+from tkinter import ttk, messagebox
+from games.game_base import DailyGame
+from games.instrumentation import timed
+from games.strands.board import get_trie, StrandsBoard
+
+WORD_COLORS = ['#aedfee', '#f9df6d', '#a0c35a', '#ba81c5', '#f4a261', '#e9c46a',
+               '#90be6d', '#f28482', '#84a59d', '#cdb4db', '#ffafcc', '#bde0fe']
+
+class StrandsSolver(DailyGame):
+    """Strands helper: paste the letter grid, list traceable words and
+    search for a set of words that covers every cell exactly once."""
+
+    def __init__(self):
+        self.trie = get_trie()
+        self.board = None
+        self.words = {}
+        self.solution = []
+
+    def create_ui(self, parent_frame):
+        main_frame = ttk.Frame(parent_frame)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        # Control Panel
+        control_frame = ttk.Frame(main_frame)
+        control_frame.pack(pady=10)
+
+        ttk.Button(control_frame, text="Find Words",
+                  command=self.find_words).pack(side=tk.LEFT, padx=5)
+        ttk.Button(control_frame, text="Solve Board",
+                  command=self.suggest_next).pack(side=tk.LEFT, padx=5)
+        ttk.Button(control_frame, text="Reset",
+                  command=self.reset_constraints).pack(side=tk.LEFT, padx=5)
+
+        boards_frame = ttk.Frame(main_frame)
+        boards_frame.pack(pady=10)
+
+        # Grid input, one row of letters per line
+        self.grid_text = tk.Text(boards_frame, width=8, height=8, font=('Courier', 12))
+        self.grid_text.pack(side=tk.LEFT, padx=5)
+
+        self.grid_frame = ttk.Frame(boards_frame)
+        self.grid_frame.pack(side=tk.LEFT, padx=5)
+
+        self.word_list = tk.Listbox(boards_frame, height=12, width=16)
+        self.word_list.pack(side=tk.LEFT, padx=5)
+
+        # Status Display
+        self.status_label = ttk.Label(main_frame, text="")
+        self.status_label.pack(pady=10)
+
+        return main_frame
+
+    def load_board(self):
+        rows = self.grid_text.get("1.0", tk.END).split()
+        try:
+            self.board = StrandsBoard(rows, self.trie)
+        except ValueError as e:
+            messagebox.showerror("Grid Error", str(e))
+            self.board = None
+        return self.board
+
+    @timed("find_words")
+    def find_words(self):
+        if not self.load_board():
+            return
+        self.words = self.board.find_words()
+        self.solution = []
+        self.word_list.delete(0, tk.END)
+        for word in sorted(self.words, key=lambda w: (-len(w), w)):
+            spangram = any(self.board.is_spangram(m) for m in self.words[word])
+            self.word_list.insert(tk.END, f"{word} *" if spangram else word)
+        self.update_grid()
+        self.status_label.config(text=f"{len(self.words)} words found (* spans the board)")
+
+    @timed("create_letter_grid")
+    def update_grid(self):
+        for widget in self.grid_frame.winfo_children():
+            widget.destroy()
+        if not self.board:
+            return
+
+        cell_colors = {}
+        for i, (word, mask) in enumerate(self.solution):
+            for cell in range(self.board.size):
+                if mask >> cell & 1:
+                    cell_colors[cell] = WORD_COLORS[i % len(WORD_COLORS)]
+
+        for cell, letter in enumerate("".join(self.board.rows)):
+            r, c = divmod(cell, self.board.width)
+            tk.Label(self.grid_frame, text=letter, width=3,
+                     bg=cell_colors.get(cell, 'white'), fg='black',
+                     font=('Arial', 12)).grid(row=r, column=c, padx=1, pady=1)
+            self.stats.count("widgets_built")
+
+    def get_suggestion(self):
+        """Implementation of abstract method from DailyGame"""
+        return self.suggest_next()
+
+    @timed("suggest_next")
+    def suggest_next(self):
+        start = time.perf_counter()
+        self.find_words()
+        if not self.board:
+            return None
+
+        with self.stats.span("suggest_next.tile"):
+            self.solution = next(self.board.tile(self.words), [])
+        self.update_grid()
+        self.record_board(self.board.rows, suggestions=[word for word, _ in self.solution],
+                          latency_ms=(time.perf_counter() - start) * 1000,
+                          aggregate=False)
+        if not self.solution:
+            self.status_label.config(text="No exact tiling found!")
+            return None
+
+        words = [word for word, _ in self.solution]
+        self.status_label.config(text="Solution: " + ", ".join(words))
+        return words
+
+    def reset_constraints(self):
+        self.board = None
+        self.words = {}
+        self.solution = []
+        self.grid_text.delete("1.0", tk.END)
+        self.word_list.delete(0, tk.END)
+        self.update_grid()
+        self.status_label.config(text="Reset complete")
+
+    def cleanup(self):
+        pass
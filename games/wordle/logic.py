@@ -0,0 +1,112 @@
+from functools import lru_cache
+from pathlib import Path
+
+WORDS_PATH = Path(__file__).parent / "valid_words.txt"
+TOP_CANDIDATES = 20  # candidates kept per cached suggestion
+
+COLOR_STATUS = {
+    '#787c7e': 'absent',
+    '#c9b458': 'present',
+    '#6aaa64': 'correct'
+}
+
+def new_constraints():
+    return {
+        'correct': {},
+        'present': set(),
+        'absent': set()
+    }
+
+
+def load_words(path=WORDS_PATH):
+    """Upper-cased word list, read from disk once per path per process."""
+    return _read_words(Path(path).resolve())
+
+
+@lru_cache(maxsize=None)
+def _read_words(path):
+    with open(path) as f:
+        return [word.strip().upper() for word in f if word.strip()]
+
+
+def apply_status(constraints, letter, col_idx, status):
+    """Fold one tile's 'correct' / 'present' / 'absent' status into `constraints`."""
+    if status == 'correct':
+        constraints['correct'][col_idx] = letter
+        if letter in constraints['absent']:
+            constraints['absent'].remove(letter)
+        if letter in constraints['present']:
+            constraints['present'].remove(letter)
+    elif status == 'present':
+        constraints['present'].add(letter)
+        if letter in constraints['absent']:
+            constraints['absent'].remove(letter)
+        if col_idx in constraints['correct']:
+            del constraints['correct'][col_idx]
+    else:
+        if letter not in constraints['present'] and letter not in constraints['correct'].values():
+            constraints['absent'].add(letter)
+
+
+def filter_words(all_words, constraints):
+    valid_words = []
+    for word in all_words:
+        valid = True
+
+        for pos, letter in constraints['correct'].items():
+            if word[pos] != letter:
+                valid = False
+                break
+
+        for letter in constraints['present']:
+            if letter not in word:
+                valid = False
+                break
+
+        for letter in constraints['absent']:
+            if letter in word and letter not in constraints['present']:
+                valid = False
+                break
+
+        if valid:
+            valid_words.append(word)
+    return valid_words
+
+
+def best_guess(word_list):
+    """Word covering the most frequent letters among the candidates."""
+    letter_scores = {}
+    for word in word_list:
+        for letter in set(word):
+            letter_scores[letter] = letter_scores.get(letter, 0) + 1
+
+    return max(word_list,
+             key=lambda word: sum(letter_scores[letter] for letter in set(word)))
+
+
+def constraints_key(constraints):
+    """Hashable, order-independent form of a constraints dict."""
+    return (
+        tuple(sorted(constraints['correct'].items())),
+        frozenset(constraints['present']),
+        frozenset(constraints['absent'])
+    )
+
+
+@lru_cache(maxsize=4096)
+def _suggest(key):
+    correct, present, absent = key
+    constraints = {'correct': dict(correct), 'present': set(present), 'absent': set(absent)}
+    candidates = filter_words(load_words(), constraints)
+    # only the head of the list is kept; a full list per entry would pin
+    # up to the whole dictionary for every cached board
+    return ((best_guess(candidates) if candidates else None), len(candidates),
+            tuple(candidates[:TOP_CANDIDATES]))
+
+
+def suggest(constraints):
+    """(suggestion, remaining, first TOP_CANDIDATES candidates) for `constraints`.
+
+    Cached across callers on the normalised constraints.
+    """
+    return _suggest(constraints_key(constraints))
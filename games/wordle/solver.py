@@ -8,6 +8,8 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
 from games.game_base import DailyGame  # Fixed import path
+from games.instrumentation import timed
+from games.wordle import logic
 
 class WordleSolver(DailyGame):
     def __init__(self):
@@ -15,11 +17,7 @@ class WordleSolver(DailyGame):
         self.service = None
         self.current_guesses = []
         self.color_states = {}
-        self.manual_constraints = {
-            'correct': {}, 
-            'present': set(), 
-            'absent': set()
-        }
+        self.manual_constraints = logic.new_constraints()
         self.auto_update_var = tk.BooleanVar(value=True)
         self.init_chrome()
         self.update_thread = threading.Thread(target=self.auto_refresh, daemon=True)
@@ -73,11 +71,7 @@ class WordleSolver(DailyGame):
 
     def reset_constraints(self): #reset progress NEEDS UPDATE
         self.color_states.clear()
-        self.manual_constraints = {
-            'correct': {},
-            'present': set(),
-            'absent': set()
-        }
+        self.manual_constraints = logic.new_constraints()
         self.force_refresh()
         self.status_label.config(text="Reset complete - synced with current game state")
     
@@ -100,6 +94,8 @@ class WordleSolver(DailyGame):
                 if new_guesses != self.current_guesses:
                     self.current_guesses = new_guesses
                     self.create_letter_grid(self.color_states)
+                    self.record_board(new_guesses, self.board_feedback(),
+                                      solved=game_data.get('status') == 'WIN')
                 else:
                     self.apply_existing_constraints()
                 
@@ -114,14 +110,17 @@ class WordleSolver(DailyGame):
             except IndexError:
                 continue
             
+    @timed("get_game_state")
     def get_game_state(self):
         try:
+            self.stats.count("driver_calls")
             keys = self.driver.execute_script("return Object.keys(localStorage);")
             wordle_key = next((k for k in keys if k.startswith("games-state-wordleV2/")), None)
             
             if not wordle_key:
                 return None
                 
+            self.stats.count("driver_calls")
             state_json = self.driver.execute_script(
                 f'return localStorage.getItem("{wordle_key}");'
             )
@@ -131,6 +130,7 @@ class WordleSolver(DailyGame):
             messagebox.showerror("State Error", str(e))
             return None
 
+    @timed("create_letter_grid")
     def create_letter_grid(self, previous_colors=None):
         for widget in self.grid_frame.winfo_children():
             widget.destroy()
@@ -153,6 +153,7 @@ class WordleSolver(DailyGame):
                 )
                 btn.grid(row=0, column=col_idx, padx=2)
                 self.letter_buttons.append((row_idx, col_idx, btn))
+                self.stats.count("widgets_built")
                 
                 self.update_constraints(row_idx, col_idx, bg_color)
 
@@ -183,75 +184,43 @@ class WordleSolver(DailyGame):
 
     def update_constraints(self, row_idx, col_idx, color):
         letter = self.current_guesses[row_idx][col_idx]
-        color_map = {
-            '#787c7e': 'absent',
-            '#c9b458': 'present',
-            '#6aaa64': 'correct'
-        }
-        status = color_map.get(color, 'absent')
-
-        if status == 'correct':
-            self.manual_constraints['correct'][col_idx] = letter
-            if letter in self.manual_constraints['absent']:
-                self.manual_constraints['absent'].remove(letter)
-            if letter in self.manual_constraints['present']:
-                self.manual_constraints['present'].remove(letter)
-        elif status == 'present':
-            self.manual_constraints['present'].add(letter)
-            if letter in self.manual_constraints['absent']:
-                self.manual_constraints['absent'].remove(letter)
-            if col_idx in self.manual_constraints['correct']:
-                del self.manual_constraints['correct'][col_idx]
-        else:
-            if letter not in self.manual_constraints['present'] and letter not in self.manual_constraints['correct'].values():
-                self.manual_constraints['absent'].add(letter)
+        status = logic.COLOR_STATUS.get(color, 'absent')
+        logic.apply_status(self.manual_constraints, letter, col_idx, status)
                 
     def get_suggestion(self):
         """Implementation of abstract method from DailyGame"""
         return self.suggest_next()
     
+    @timed("suggest_next")
     def suggest_next(self):
-        with open('./games/wordle/valid_words.txt') as f:
-            all_words = [word.strip().upper() for word in f]
-
-        valid_words = []
-        for word in all_words:
-            valid = True
-            
-            for pos, letter in self.manual_constraints['correct'].items():
-                if word[pos] != letter:
-                    valid = False
-                    break
-                    
-            for letter in self.manual_constraints['present']:
-                if letter not in word:
-                    valid = False
-                    break
-                    
-            for letter in self.manual_constraints['absent']:
-                if letter in word and letter not in self.manual_constraints['present']:
-                    valid = False
-                    break
-
-            if valid:
-                valid_words.append(word)
+        start = time.perf_counter()
+        with self.stats.span("suggest_next.filter"):
+            valid_words = logic.filter_words(logic.load_words(), self.manual_constraints)
+        self.stats.count("candidates_scored", len(valid_words))
 
         if valid_words:
-            suggestion = self.get_best_guess(valid_words)
+            with self.stats.span("suggest_next.score"):
+                suggestion = self.get_best_guess(valid_words)
             self.status_label.config(text=f"Suggested: {suggestion}")
-            return suggestion
         else:
+            suggestion = None
             self.status_label.config(text="No valid words found!")
-            return None
+
+        self.record_board(self.current_guesses, self.board_feedback(),
+                          [suggestion] if suggestion else [],
+                          (time.perf_counter() - start) * 1000)
+        return suggestion
+
+    def board_feedback(self):
+        """Per-guess tile statuses as currently colored in the grid."""
+        return [
+            [logic.COLOR_STATUS.get(self.color_states.get((row, col)), 'absent')
+             for col in range(len(guess))]
+            for row, guess in enumerate(self.current_guesses)
+        ]
 
     def get_best_guess(self, word_list):
-        letter_scores = {}
-        for word in word_list:
-            for letter in set(word):
-                letter_scores[letter] = letter_scores.get(letter, 0) + 1
-        
-        return max(word_list, 
-                 key=lambda word: sum(letter_scores[letter] for letter in set(word)))
+        return logic.best_guess(word_list)
 
     def cleanup(self):
         if self.driver:
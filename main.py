@@ -1,14 +1,19 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 import importlib.util
 from pathlib import Path
+import argparse
+import cProfile
 import sys
+import time
 
 class GameSelector:
-    def __init__(self):
+    def __init__(self, profile=False):
         self.root = tk.Tk()
         self.root.title("Daily Game Solver")
         self.current_game = None
+        self.profile = profile
+        self.profiler = None
         
         # Get project root
         self.project_root = Path(__file__).parent
@@ -40,6 +45,9 @@ class GameSelector:
         )
         self.selector.pack(pady=5)
         self.selector.bind("<<ComboboxSelected>>", self.load_game)
+
+        ttk.Button(main_frame, text="Stats",
+                  command=self.show_stats).pack(pady=5)
         
         # Remove auto-loading of first game
         self.game_container = ttk.Frame(main_frame)
@@ -49,6 +57,7 @@ class GameSelector:
         # Cleanup previous game
         if self.current_game:
             self.current_game.cleanup()
+            self.end_session()
             for widget in self.game_container.winfo_children():
                 widget.destroy()
 
@@ -73,18 +82,83 @@ class GameSelector:
             solver_class = getattr(game_module, class_name)
             
             # Initialize game
+            self.start_session()
             self.current_game = solver_class()
             game_frame = self.current_game.create_ui(self.game_container)
             game_frame.pack(fill=tk.BOTH, expand=True)
         
         except Exception as e:
+            if self.profiler:
+                self.profiler.disable()
+                self.profiler = None
             messagebox.showerror("Error", f"Failed to load {game_name}: {str(e)}")
 
+    def start_session(self):
+        if self.profile:
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+
+    def end_session(self):
+        """Write cProfile output and span stats for the game that just closed."""
+        if not self.profiler:
+            return
+        self.profiler.disable()
+        profile_dir = self.project_root / "profiles"
+        profile_dir.mkdir(exist_ok=True)
+        stem = profile_dir / f"{type(self.current_game).__name__}-{time.strftime('%Y%m%d-%H%M%S')}"
+        self.profiler.dump_stats(f"{stem}.prof")
+        self.current_game.stats.export(f"{stem}.json")
+        self.profiler = None
+
+    def show_stats(self):
+        if not self.current_game:
+            messagebox.showinfo("Stats", "No game loaded")
+            return
+
+        window = tk.Toplevel(self.root)
+        window.title(f"Stats - {self.game_var.get()}")
+        text = tk.Text(window, width=70, height=20, font=('Courier', 10))
+        text.pack(padx=10, pady=10)
+
+        def refresh():
+            data = self.current_game.stats.snapshot()
+            lines = [f"{'span':<28}{'count':>7}{'mean ms':>10}{'p95 ms':>10}{'max ms':>10}"]
+            for name, span in sorted(data['spans'].items()):
+                lines.append(f"{name:<28}{span['count']:>7}{span['mean_ms']:>10.2f}"
+                             f"{span['p95_ms']:>10.2f}{span['max_ms']:>10.2f}")
+            lines.append("")
+            lines.extend(f"{name:<28}{value:>7}" for name, value in sorted(data['counters'].items()))
+            text.delete("1.0", tk.END)
+            text.insert(tk.END, "\n".join(lines))
+
+        def export():
+            path = filedialog.asksaveasfilename(
+                parent=window,
+                defaultextension=".json",
+                filetypes=[("JSON", "*.json"), ("CSV", "*.csv")]
+            )
+            if path:
+                self.current_game.stats.export(path)
+
+        button_frame = ttk.Frame(window)
+        button_frame.pack(pady=5)
+        ttk.Button(button_frame, text="Refresh", command=refresh).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Reset",
+                  command=lambda: (self.current_game.stats.reset(), refresh())).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Export", command=export).pack(side=tk.LEFT, padx=5)
+        refresh()
+
     def run(self):
         self.root.mainloop()
         if self.current_game:
             self.current_game.cleanup()
+            self.end_session()
 
 if __name__ == "__main__":
-    selector = GameSelector()
+    parser = argparse.ArgumentParser(description="Daily Game Solver")
+    parser.add_argument("--profile", action="store_true",
+                        help="write cProfile output and span stats per game session to profiles/")
+    args = parser.parse_args()
+
+    selector = GameSelector(profile=args.profile)
     selector.run()
\ No newline at end of file
@@ -0,0 +1,343 @@
+"""HTTP/JSON solver service.
+
+Serves the Wordle and LoLdle solving logic to many clients at once without
+a browser or Tk window. Word lists and the LoLdle dataset are loaded once
+at start-up and shared by every request; suggestions are cached on the
+normalised board state.
+
+    python server.py --port 8000 --workers 8 --queue 64
+
+Endpoints:
+    GET  /health
+    GET  /stats
+    POST /wordle/suggest  {"guesses": [{"word": "TARES", "statuses": ["absent", ...]}]}
+    POST /loldle/suggest  {"guesses": [{"champion": "Warwick", "feedback": {"gender": "correct", ...}}]}
+
+Requests are handled by a fixed thread pool. New and keep-alive
+connections wait in IdleConnections, a selector that queues a connection
+for a worker only once its next request starts arriving, and a worker
+serves one request before handing the connection back. Idle clients
+therefore never hold a worker. Once `workers + queue` requests are in flight, new
+ones are answered immediately with 503 and a Retry-After header instead
+of piling up.
+"""
+import argparse
+import json
+import queue
+import selectors
+import socket
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent))
+
+from games.instrumentation import Instrumentation
+from games.wordle import logic as wordle_logic
+from games.LoLdle import logic as loldle_logic
+from games.LoLdle.dataset import load_dataset
+
+MAX_BODY = 64 * 1024
+IDLE_TIMEOUT = 5  # seconds a keep-alive connection may wait between requests
+OVERLOADED = (
+    b"HTTP/1.1 503 Service Unavailable\r\n"
+    b"Content-Type: application/json\r\n"
+    b"Content-Length: 24\r\n"
+    b"Retry-After: 1\r\n"
+    b"Connection: close\r\n\r\n"
+    b'{"error": "overloaded"}\n'
+)
+
+
+def wordle_suggest(payload):
+    constraints = wordle_logic.new_constraints()
+    for guess in payload.get('guesses', []):
+        word = guess['word'].strip().upper()
+        statuses = guess['statuses']
+        if len(word) != 5 or len(statuses) != 5:
+            raise ValueError("Each guess needs a 5-letter word and 5 statuses")
+        for col_idx, (letter, status) in enumerate(zip(word, statuses)):
+            if status not in ('correct', 'present', 'absent'):
+                raise ValueError(f"Unknown status: {status}")
+            wordle_logic.apply_status(constraints, letter, col_idx, status)
+
+    suggestion, remaining, candidates = wordle_logic.suggest(constraints)
+    return {
+        'suggestion': suggestion,
+        'remaining': remaining,
+        'candidates': list(candidates)
+    }
+
+
+def loldle_suggest(payload):
+    guesses = [(guess['champion'], guess['feedback']) for guess in payload.get('guesses', [])]
+    suggestion, remaining, candidates = loldle_logic.suggest(guesses)
+    return {
+        'suggestion': suggestion,
+        'remaining': remaining,
+        'candidates': list(candidates)
+    }
+
+
+ROUTES = {
+    '/wordle/suggest': wordle_suggest,
+    '/loldle/suggest': loldle_suggest
+}
+
+
+class SolverHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    timeout = 5  # a request that has started arriving must finish within this
+    disable_nagle_algorithm = True  # headers and body go out as separate writes
+
+    def handle(self):
+        # One request per worker turn; the server parks the connection after.
+        # Pipelined requests already read into rfile would be lost, so serve
+        # those here.
+        self.handle_one_request()
+        while not self.close_connection and self.buffered():
+            self.handle_one_request()
+
+    def buffered(self):
+        """True if the next request is already waiting, without blocking."""
+        self.connection.settimeout(0)
+        try:
+            return bool(self.rfile.peek(1))
+        except OSError:
+            return False
+        finally:
+            self.connection.settimeout(self.timeout)
+
+    def do_GET(self):
+        if self.path == '/health':
+            self.send_json(200, {'status': 'ok'})
+        elif self.path == '/stats':
+            self.send_json(200, self.server.stats.snapshot())
+        else:
+            self.send_json(404, {'error': 'not found'})
+
+    def do_POST(self):
+        route = ROUTES.get(self.path)
+        if route is None:
+            self.close_connection = True  # the body is left unread
+            self.send_json(404, {'error': 'not found'})
+            return
+
+        length = self.headers.get('Content-Length')
+        if length is None:
+            self.close_connection = True
+            self.send_json(411, {'error': 'Content-Length required'})
+            return
+        try:
+            length = int(length)
+            if length < 0:
+                raise ValueError
+        except ValueError:
+            self.server.stats.count('bad_requests')
+            self.close_connection = True
+            self.send_json(400, {'error': 'invalid Content-Length'})
+            return
+        if length > MAX_BODY:
+            self.close_connection = True
+            self.send_json(413, {'error': 'request too large'})
+            return
+
+        stats = self.server.stats
+        with stats.span(self.path):
+            try:
+                payload = json.loads(self.rfile.read(length) or b'{}')
+                result = route(payload)
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                stats.count('bad_requests')
+                self.send_json(400, {'error': str(e)})
+                return
+        stats.count('requests')
+        self.send_json(200, result)
+
+    def send_json(self, status, data):
+        body = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        if self.close_connection:
+            self.send_header('Connection', 'close')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # per-request logging would dominate the hot path
+
+
+class IdleConnections:
+    """Keep-alive connections waiting for their next request.
+
+    A single selector thread watches every parked socket and passes it to
+    `dispatch` as soon as it becomes readable. Sockets idle for longer than
+    `timeout` are closed with `close`. Parking happens from worker threads,
+    so new sockets go through a queue and a wake-up socket.
+    """
+
+    def __init__(self, dispatch, close, timeout=IDLE_TIMEOUT):
+        self.dispatch = dispatch
+        self.close = close
+        self.timeout = timeout
+        self.incoming = queue.SimpleQueue()
+        self.selector = selectors.DefaultSelector()
+        self.wake_r, self.wake_w = socket.socketpair()
+        self.wake_r.setblocking(False)
+        self.wake_w.setblocking(False)
+        self.selector.register(self.wake_r, selectors.EVENT_READ)
+        self.running = True
+        self.thread = threading.Thread(target=self.run, name="idle-connections", daemon=True)
+        self.thread.start()
+
+    def park(self, request, client_address):
+        self.incoming.put((request, client_address))
+        self.wake()
+
+    def wake(self):
+        try:
+            self.wake_w.send(b"\0")
+        except BlockingIOError:
+            pass  # a wake-up is already pending
+
+    def run(self):
+        # socket -> (client address, deadline); deadlines grow with insertion
+        # order, so the oldest entry is always the next to expire
+        idle = {}
+        while self.running:
+            timeout = None
+            if idle:
+                deadline = next(iter(idle.values()))[1]
+                timeout = max(0, deadline - time.monotonic())
+            for key, _ in self.selector.select(timeout):
+                if key.fileobj is self.wake_r:
+                    try:
+                        while self.wake_r.recv(4096):
+                            pass
+                    except BlockingIOError:
+                        pass
+                    continue
+                self.selector.unregister(key.fileobj)
+                client_address, _ = idle.pop(key.fileobj)
+                self.dispatch(key.fileobj, client_address)
+
+            while True:
+                try:
+                    request, client_address = self.incoming.get_nowait()
+                except queue.Empty:
+                    break
+                self.selector.register(request, selectors.EVENT_READ)
+                idle[request] = (client_address, time.monotonic() + self.timeout)
+
+            now = time.monotonic()
+            while idle:
+                request, (_, deadline) = next(iter(idle.items()))
+                if deadline > now:
+                    break
+                del idle[request]
+                self.selector.unregister(request)
+                self.close(request)
+
+        for request in idle:
+            self.close(request)
+        self.selector.close()
+        self.wake_r.close()
+        self.wake_w.close()
+
+    def shutdown(self):
+        self.running = False
+        self.wake()
+        self.thread.join()
+
+
+class SolverServer(HTTPServer):
+    """HTTPServer that runs each request on a bounded thread pool."""
+
+    request_queue_size = 128  # accept bursts so they can be answered with 503
+
+    def __init__(self, address, workers=8, queue_size=64):
+        super().__init__(address, SolverHandler)
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="solver")
+        self.slots = threading.BoundedSemaphore(workers + queue_size)
+        self.stats = Instrumentation("server")
+        self.idle = IdleConnections(self.dispatch, self.shutdown_request)
+
+    def process_request(self, request, client_address):
+        self.idle.park(request, client_address)
+
+    def dispatch(self, request, client_address):
+        """Queue the request waiting on a connection for a worker."""
+        if not self.slots.acquire(blocking=False):
+            self.stats.count('rejected')
+            try:
+                request.sendall(OVERLOADED)
+            except OSError:
+                pass
+            finally:
+                self.shutdown_request(request)
+            return
+        try:
+            self.pool.submit(self.process_request_thread, request, client_address)
+        except RuntimeError:  # pool shut down
+            self.slots.release()
+            self.shutdown_request(request)
+
+    def process_request_thread(self, request, client_address):
+        keep_alive = False
+        try:
+            handler = self.RequestHandlerClass(request, client_address, self)
+            keep_alive = not handler.close_connection
+        except ConnectionError:
+            pass  # client went away mid-request
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.slots.release()
+            if keep_alive:
+                self.idle.park(request, client_address)
+            else:
+                self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self.idle.shutdown()
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+
+def warm_up():
+    """Load shared indexes and prime the caches for the empty board."""
+    start = time.perf_counter()
+    load_dataset()
+    wordle_logic.load_words()
+    wordle_suggest({})
+    loldle_suggest({})
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Daily Game Solver HTTP service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--queue", type=int, default=64,
+                        help="connections allowed to wait for a worker before 503s")
+    args = parser.parse_args()
+
+    print(f"Loaded solver data in {warm_up() * 1000:.0f} ms")
+    server = SolverServer((args.host, args.port), args.workers, args.queue)
+    print(f"Serving on http://{args.host}:{args.port} "
+          f"({args.workers} workers, queue {args.queue})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Make the `games` package importable the same way main.py does
+sys.path.append(str(Path(__file__).parent.parent))
@@ -0,0 +1,116 @@
+import datetime
+import pytest
+from games import history
+from games.history import HistoryStore
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(history, "FLUSH_INTERVAL", 0.01)
+    return HistoryStore(tmp_path / "history.sqlite3")
+
+
+def daily(store, game="wordle"):
+    return store.query("SELECT * FROM daily WHERE game = ?", (game,))
+
+
+def test_records_are_batched_to_both_tables(store):
+    store.record("wordle", ["TARES", "CLOUD"], player="ann", date="2024-05-01",
+                 latency_ms=3.0)
+    store.record("wordle", ["TARES", "CLOUD", "BLOWN"], solved=True, player="ann",
+                 date="2024-05-01")
+    assert len(store.query("SELECT * FROM observations")) == 2
+    [row] = daily(store)
+    assert (row['num_guesses'], row['solved'], row['opener']) == (3, 1, "TARES")
+
+
+def test_suggestion_after_win_keeps_the_win(store):
+    store.record("wordle", ["TARES", "BLOWN"], solved=True, player="ann", date="2024-05-01")
+    # suggest_next records the board again without the solved flag
+    store.record("wordle", ["TARES", "BLOWN"], suggestions=["PLUMB"], player="ann",
+                 date="2024-05-01")
+    [row] = daily(store)
+    assert row['solved'] == 1
+    assert store.summary("wordle")['solved'] == 1
+
+
+def test_shorter_board_does_not_replace_the_day(store):
+    store.record("wordle", ["TARES", "CLOUD", "BLOWN"], player="ann", date="2024-05-01")
+    store.record("wordle", ["CRANE"], player="ann", date="2024-05-01")
+    [row] = daily(store)
+    assert row['num_guesses'] == 3
+    assert row['opener'] == "TARES"
+    assert row['guesses'] == '["TARES", "CLOUD", "BLOWN"]'
+
+
+def test_unaggregated_boards_skip_daily(store):
+    store.record("mini", ["HEART", "EMBER"], suggestions=["HEART/EMBER"], latency_ms=12.0,
+                 aggregate=False)
+    assert daily(store, "mini") == []
+    assert store.latency("mini")['samples'] == 1
+
+
+def test_summary_distribution_and_openers(store):
+    for day, guesses, solved in [(1, 3, True), (2, 4, True), (3, 6, False), (4, 3, True)]:
+        opener = "TARES" if day % 2 else "CRANE"
+        store.record("wordle", [opener] + ["XXXXX"] * (guesses - 1), solved=solved,
+                     player="ann", date=f"2024-05-0{day}")
+    summary = store.summary("wordle", "ann")
+    assert (summary['played'], summary['solved']) == (4, 3)
+    assert summary['avg_guesses'] == pytest.approx(10 / 3)
+    assert store.guess_distribution("wordle") == {3: 2, 4: 1}
+    openers = {row['opener']: row for row in store.opener_stats("wordle")}
+    assert (openers["TARES"]['avg_guesses'], openers["TARES"]['solve_rate']) == (3, 0.5)
+    assert (openers["CRANE"]['avg_guesses'], openers["CRANE"]['solve_rate']) == (3.5, 1)
+
+
+def test_streaks(store):
+    today = datetime.date.today()
+    for offset in (5, 4, 3, 1, 0):
+        store.record("wordle", ["TARES"], solved=True, player="ann",
+                     date=(today - datetime.timedelta(days=offset)).isoformat())
+    assert store.streaks("wordle", "ann") == {'current': 2, 'longest': 3}
+
+
+def test_bad_board_fails_in_the_caller(store):
+    for day in range(1, 6):
+        store.record("wordle", ["TARES"], player="ann", date=f"2024-05-0{day}")
+    with pytest.raises(TypeError):
+        store.record("wordle", [object()])  # not JSON serialisable
+    assert len(store.query("SELECT * FROM observations")) == 5
+    assert len(daily(store)) == 5
+
+
+def test_writer_survives_unexpected_errors(store, monkeypatch):
+    errors = []
+    monkeypatch.setattr(history, "report_error", errors.append)
+    write_batch = store.write_batch
+
+    def fail_once(conn, batch):
+        monkeypatch.setattr(store, "write_batch", write_batch)
+        raise RuntimeError("disk on fire")
+
+    monkeypatch.setattr(store, "write_batch", fail_once)
+    store.record("wordle", ["CRANE"], player="ann", date="2024-05-01")
+    store.flush()
+    store.record("wordle", ["TARES"], player="ann", date="2024-05-02")
+    assert [row['opener'] for row in daily(store)] == ["TARES"]
+    assert len(errors) == 1 and isinstance(errors[0], RuntimeError)
+
+
+def test_queries_close_their_connections(store, monkeypatch):
+    opened = []
+    connect = store.connect
+
+    def tracking_connect():
+        conn = connect()
+        opened.append(conn)
+        return conn
+
+    monkeypatch.setattr(store, "connect", tracking_connect)
+    store.summary("wordle")
+    store.latency("wordle")
+    assert len(opened) == 2
+    for conn in opened:
+        with pytest.raises(history.sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
@@ -0,0 +1,99 @@
+import csv
+import json
+import pytest
+from games.instrumentation import Instrumentation, timed, SAMPLE_WINDOW
+
+
+def test_span_summary():
+    stats = Instrumentation("wordle")
+    for ms in range(1, 101):
+        stats.record("filter", ms / 1000)
+    span = stats.snapshot()['spans']['filter']
+    assert span['count'] == 100
+    assert span['total_ms'] == pytest.approx(5050)
+    assert span['mean_ms'] == pytest.approx(50.5)
+    assert span['p95_ms'] == pytest.approx(95)  # nearest rank over sorted samples
+    assert span['max_ms'] == pytest.approx(100)
+
+
+def test_single_sample_percentile():
+    stats = Instrumentation("wordle")
+    stats.record("filter", 0.002)
+    assert stats.snapshot()['spans']['filter']['p95_ms'] == pytest.approx(2)
+
+
+def test_percentile_uses_recent_window_but_max_is_all_time():
+    stats = Instrumentation("wordle")
+    stats.record("filter", 1.0)
+    for _ in range(SAMPLE_WINDOW):
+        stats.record("filter", 0.001)
+    span = stats.snapshot()['spans']['filter']
+    assert span['count'] == SAMPLE_WINDOW + 1
+    assert span['p95_ms'] == pytest.approx(1)
+    assert span['max_ms'] == pytest.approx(1000)
+
+
+def test_span_records_on_exception():
+    stats = Instrumentation("wordle")
+    with pytest.raises(RuntimeError):
+        with stats.span("boom"):
+            raise RuntimeError
+    assert stats.snapshot()['spans']['boom']['count'] == 1
+
+
+def test_counters_and_reset():
+    stats = Instrumentation("wordle")
+    stats.count("driver_calls")
+    stats.count("driver_calls", 4)
+    stats.record("filter", 0.001)
+    assert stats.snapshot()['counters'] == {'driver_calls': 5}
+    started = stats.started
+    stats.reset()
+    snapshot = stats.snapshot()
+    assert snapshot['spans'] == {} and snapshot['counters'] == {}
+    assert stats.started >= started
+
+
+def test_export_json(tmp_path):
+    stats = Instrumentation("wordle")
+    stats.record("filter", 0.004)
+    stats.count("widgets_built", 30)
+    path = tmp_path / "stats.json"
+    stats.export(path)
+    data = json.loads(path.read_text())
+    assert data['game'] == "wordle"
+    assert data['spans']['filter']['total_ms'] == pytest.approx(4)
+    assert data['counters'] == {'widgets_built': 30}
+
+
+def test_export_csv(tmp_path):
+    stats = Instrumentation("wordle")
+    stats.record("filter", 0.004)
+    stats.count("widgets_built", 30)
+    path = tmp_path / "stats.CSV"
+    stats.export(path)
+    with open(path, newline='') as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ['game', 'kind', 'name', 'count', 'total_ms', 'mean_ms', 'p95_ms',
+                       'max_ms']
+    assert rows[1] == ['wordle', 'span', 'filter', '1', '4.000', '4.000', '4.000', '4.000']
+    assert rows[2] == ['wordle', 'counter', 'widgets_built', '30', '', '', '', '']
+
+
+class Game:
+    def __init__(self):
+        self.stats = Instrumentation("game")
+
+    @timed("suggest_next")
+    def suggest_next(self, word, suffix=""):
+        """Docstring kept."""
+        return word + suffix
+
+
+def test_timed_decorator():
+    game = Game()
+    assert game.suggest_next("TARES", suffix="!") == "TARES!"
+    assert game.suggest_next("CRANE") == "CRANE"
+    assert game.stats.snapshot()['spans']['suggest_next']['count'] == 2
+    assert Game.suggest_next.__doc__ == "Docstring kept."
+    assert Game.suggest_next.__name__ == "suggest_next"
@@ -0,0 +1,61 @@
+import pickle
+import pytest
+from games.LoLdle.dataset import (
+    Gender, Position, RangeType, Resource, build_dataset, load_cached, parse_csv
+)
+
+CSV = (
+    'Champion Name, Gender, Position(s), Species, Resource, Range Type, Region(s), Release Year\n'
+    'Elise,"Female","Jungle","Human,  Magically Altered","Mana","Melee,  Ranged",'
+    '"Noxus,  Shadow Isles","2012"\n'
+    'Garen,"Male","Top","Human","Manaless","Melee","Demacia","2010"\n'
+)
+
+
+def test_parse_csv_types():
+    elise, garen = parse_csv(CSV)
+    assert elise.name == "Elise"
+    assert elise.gender is Gender.FEMALE
+    assert elise.positions == {Position.JUNGLE}
+    assert elise.species == {"Human", "Magically Altered"}
+    assert elise.range_types == {RangeType.MELEE, RangeType.RANGED}
+    assert elise.regions == {"Noxus", "Shadow Isles"}
+    assert elise.release_year == 2012
+    assert garen.resource is Resource.MANALESS
+
+
+def test_equal_sets_are_shared():
+    elise, garen = parse_csv(CSV)
+    assert elise.species & garen.species == {"Human"}
+    assert parse_csv(CSV)[1].species is garen.species
+
+
+def test_bad_value_names_the_row():
+    with pytest.raises(ValueError, match="Garen"):
+        parse_csv(CSV.replace('"Manaless"', '"Mystery"'))
+
+
+def test_cache_round_trip(tmp_path):
+    csv_path, cache_path = tmp_path / "data.csv", tmp_path / "data.cache"
+    csv_path.write_text(CSV)
+    built = build_dataset(csv_path, cache_path)
+    cached = load_cached(csv_path, cache_path)
+    assert cached.champions == built.champions
+    assert cached.get(" elise ").release_year == 2012
+
+
+def test_cache_rebuilds_when_csv_changes(tmp_path):
+    csv_path, cache_path = tmp_path / "data.csv", tmp_path / "data.cache"
+    csv_path.write_text(CSV)
+    build_dataset(csv_path, cache_path)
+    csv_path.write_text(CSV.replace('"2010"', '"2009"'))
+    assert load_cached(csv_path, cache_path).get("Garen").release_year == 2009
+    with open(cache_path, 'rb') as f:
+        assert pickle.load(f)['champions'][1].release_year == 2009
+
+
+def test_unreadable_cache_is_rebuilt(tmp_path):
+    csv_path, cache_path = tmp_path / "data.csv", tmp_path / "data.cache"
+    csv_path.write_text(CSV)
+    cache_path.write_bytes(b"not a pickle")
+    assert len(load_cached(csv_path, cache_path)) == 2
@@ -0,0 +1,65 @@
+from games.mini.fill import WordIndex, CrosswordFill, find_slots
+
+WORDS = ["NAP", "ORE", "TEA", "NOT", "ARE", "PEA", "TAN", "TEN", "CAT", "ACE",
+         "HEART", "EMBER"]
+
+
+def index():
+    return WordIndex(WORDS)
+
+
+def test_slots_skip_blocks_and_single_cells():
+    slots = find_slots(["..#", "...", "#.."])
+    assert sorted(len(s) for s in slots) == [2, 2, 2, 2, 3, 3]
+
+
+def test_word_square_fill():
+    fills = list(CrosswordFill(["N.P", "...", "..A"], index()).solve())
+    assert fills == [["NAP", "ORE", "TEA"]]
+
+
+def test_given_letters_constrain_fill():
+    grid = ["...", "...", "..A"]
+    fills = list(CrosswordFill(grid, index()).solve())
+    assert fills
+    for fill in CrosswordFill(grid, index()).solve():
+        assert fill[2][2] == "A"
+        columns = ["".join(row[c] for row in fill) for c in range(3)]
+        assert all(word in WORDS for word in fill + columns)
+
+
+def test_no_repeated_entries():
+    # ARE is the only word fitting two slots; a fill would need it twice
+    grid = ["ARE", "R..", "E.."]
+    assert list(CrosswordFill(grid, index()).solve()) == []
+
+
+def test_missing_lengths_reported():
+    fill = CrosswordFill(["##...", "#....", ".....", "....#", "...##"], index())
+    assert fill.missing_lengths() == [4]
+    assert list(fill.solve()) == []
+
+
+def test_limit():
+    grid = ["...", "...", "..."]
+    assert len(list(CrosswordFill(grid, index()).solve(limit=1))) <= 1
+
+
+def test_symmetric_square_needs_repeats():
+    # rows and columns of this square are the same three words
+    index = WordIndex(["BAT", "ARE", "TEN"])
+    assert list(CrosswordFill(["B..", "...", "..."], index).solve()) == []
+
+
+def test_seeded_grid_never_repeats_a_word():
+    from games.mini.fill import get_index
+    grid = ["AAHED", "A....", ".....", ".....", "....."]
+    fill = CrosswordFill(grid, get_index())
+    fills = list(fill.solve(limit=20))
+    assert fills
+    for rows in fills:
+        entries = rows + ["".join(col) for col in zip(*rows)]
+        assert len(set(entries)) == len(entries)
+    # only a repeated HEART could complete this one
+    assert list(CrosswordFill(["HEART", "E....", "A....", "R....", "T...."],
+                              get_index()).solve()) == []
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+from games.quordle.engine import PatternEngine, ALL_GREEN
+
+
+def reference(guess, answer):
+    """Scalar Wordle scoring: greens first, then yellows left to right."""
+    result = ['absent'] * 5
+    left = []
+    for i in range(5):
+        if guess[i] == answer[i]:
+            result[i] = 'correct'
+        else:
+            left.append(answer[i])
+    for i in range(5):
+        if result[i] == 'absent' and guess[i] in left:
+            result[i] = 'present'
+            left.remove(guess[i])
+    return result
+
+
+WORDS = ["SPEED", "ABIDE", "EERIE", "THEME", "SASSY", "ASSET", "LLAMA",
+         "ALLOY", "LOYAL", "ABBEY", "BABES", "CRANE"]
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return PatternEngine(WORDS)
+
+
+def code(engine, guess, answer):
+    return int(engine.patterns([engine.index[guess]], [engine.index[answer]])[0, 0])
+
+
+@pytest.mark.parametrize("guess, answer, expected", [
+    # second E has no E left to claim
+    ("SPEED", "ABIDE", ['absent', 'absent', 'present', 'absent', 'present']),
+    # green E at the end uses one E, only the first guessed E turns yellow
+    ("EERIE", "THEME", ['present', 'absent', 'absent', 'absent', 'correct']),
+    # a green S takes its letter before earlier S's are considered
+    ("SASSY", "ASSET", ['present', 'present', 'correct', 'absent', 'absent']),
+    ("LLAMA", "ALLOY", ['present', 'correct', 'present', 'absent', 'absent']),
+    ("ABBEY", "BABES", ['present', 'present', 'correct', 'correct', 'absent']),
+])
+def test_duplicate_letters(engine, guess, answer, expected):
+    assert reference(guess, answer) == expected
+    assert code(engine, guess, answer) == engine.pattern_code(expected)
+
+
+def test_matches_reference_for_all_pairs(engine):
+    codes = engine.patterns(np.arange(len(engine)), np.arange(len(engine)))
+    for g, guess in enumerate(WORDS):
+        for a, answer in enumerate(WORDS):
+            assert codes[g, a] == engine.pattern_code(reference(guess, answer)), (guess, answer)
+
+
+def test_all_green_code(engine):
+    assert code(engine, "CRANE", "CRANE") == ALL_GREEN
+
+
+def test_filter_keeps_consistent_candidates(engine):
+    candidates = np.arange(len(engine))
+    observed = code(engine, "SPEED", "ABIDE")
+    kept = {engine.words[i] for i in engine.filter(candidates, "SPEED", observed)}
+    assert "ABIDE" in kept
+    assert all(reference("SPEED", word) == reference("SPEED", "ABIDE") for word in kept)
+
+
+def test_single_candidate_board_is_solved_first(engine):
+    boards = [np.arange(len(engine)), np.array([engine.index["LOYAL"]])]
+    assert engine.best_joint_guess(boards) == "LOYAL"
+
+
+def test_pattern_code_is_static():
+    assert PatternEngine.pattern_code(['correct'] * 5) == ALL_GREEN
+
+
+def test_suggestion_is_stable_for_the_same_boards():
+    from games.quordle.engine import get_engine
+    engine = get_engine()
+    tares = engine.index["TARES"]
+    boards = []
+    for answer in ["CLOUD", "PINKY", "MOVIE", "GHOUL", "BUMPY", "NOISY", "LIMBO", "WHELP"]:
+        code = int(engine.patterns([tares], [engine.index[answer]])[0, 0])
+        boards.append(engine.filter(np.arange(len(engine)), "TARES", code))
+    assert engine.best_joint_guess(boards) == engine.best_joint_guess(boards)
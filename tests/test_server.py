@@ -0,0 +1,95 @@
+import http.client
+import json
+import socket
+import threading
+import pytest
+from server import SolverServer
+
+TARES = {"guesses": [{"word": "TARES",
+                      "statuses": ["absent", "present", "absent", "absent", "correct"]}]}
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = SolverServer(("127.0.0.1", 0), workers=2, queue_size=2)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def raw(server, data):
+    with socket.create_connection(server.server_address, timeout=5) as sock:
+        sock.sendall(data)
+        sock.shutdown(socket.SHUT_WR)
+        chunks = []
+        while chunk := sock.recv(65536):
+            chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def status(response):
+    return int(response.split(b" ", 2)[1])
+
+
+def post(path, body):
+    return (f"POST {path} HTTP/1.1\r\nHost: x\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n").encode() + body
+
+
+@pytest.mark.parametrize("length, expected", [("abc", 400), ("-1", 400)])
+def test_bad_content_length(server, length, expected):
+    response = raw(server, b"POST /wordle/suggest HTTP/1.1\r\nHost: x\r\n"
+                           b"Content-Length: " + length.encode() + b"\r\n\r\n{}")
+    assert status(response) == expected
+    assert b"Connection: close" in response
+
+
+def test_missing_content_length(server):
+    response = raw(server, b"POST /wordle/suggest HTTP/1.1\r\nHost: x\r\n\r\n")
+    assert status(response) == 411
+
+
+def test_keep_alive_connection_serves_many_requests(server):
+    conn = http.client.HTTPConnection(*server.server_address, timeout=5)
+    body = json.dumps(TARES)
+    # more requests than workers + queue slots: the connection is parked,
+    # not holding a slot, between requests
+    for _ in range(10):
+        conn.request("POST", "/wordle/suggest", body)
+        response = conn.getresponse()
+        assert response.status == 200
+        assert json.loads(response.read())['suggestion']
+    conn.close()
+
+
+def test_idle_connections_do_not_hold_workers(server):
+    idle = [socket.create_connection(server.server_address) for _ in range(8)]
+    try:
+        for sock in idle:  # one request each, then leave them open
+            sock.sendall(b"GET /health HTTP/1.1\r\nHost: x\r\n\r\n")
+            assert b"200 OK" in sock.recv(4096)
+        conn = http.client.HTTPConnection(*server.server_address, timeout=5)
+        conn.request("GET", "/health")
+        assert conn.getresponse().status == 200
+        conn.close()
+    finally:
+        for sock in idle:
+            sock.close()
+
+
+def test_pipelined_requests(server):
+    body = json.dumps(TARES).encode()
+    response = raw(server, post("/wordle/suggest", body) * 3)
+    assert response.count(b"HTTP/1.1 200 OK") == 3
+
+
+def test_invalid_loldle_status(server):
+    body = json.dumps({"guesses": [{"champion": "Ahri", "feedback": {
+        "gender": "correct", "positions": "correct", "species": "correct",
+        "resource": "correct", "range_types": "correct", "regions": "correct",
+        "release_year": "partial"}}]}).encode()
+    response = raw(server, post("/loldle/suggest", body))
+    assert status(response) == 400
+    assert b"release_year" in response
@@ -0,0 +1,71 @@
+import pytest
+from games.strands.board import Trie, StrandsBoard
+
+WORDS = ["CART", "CARTS", "STAR", "RATS", "ARTS", "TSAR", "STRAND"]
+
+
+def trie():
+    return Trie(WORDS)
+
+
+def contains(trie, word):
+    node = 0
+    for letter in word:
+        node = trie.children[node * 26 + ord(letter) - 65]
+        if not node:
+            return False
+    return bool(trie.terminal[node])
+
+
+def test_trie_membership_and_prefixes():
+    t = trie()
+    assert all(contains(t, word) for word in WORDS)
+    assert not contains(t, "CAR")  # prefix only
+    assert not contains(t, "STRANDS")
+
+
+def test_trie_shares_prefixes():
+    # CART and CARTS share every node but one
+    assert len(Trie(["CART", "CARTS"])) == len(Trie(["CARTS"]))
+
+
+def test_from_files_skips_missing_and_short(tmp_path):
+    extra = tmp_path / "words.txt"
+    extra.write_text("cab\ncabin\n\n")
+    t = Trie.from_files([extra, tmp_path / "missing.txt"])
+    assert contains(t, "CABIN")
+    assert not contains(t, "CAB")
+
+
+def test_find_words_follows_adjacency():
+    board = StrandsBoard(["CA", "TR"], trie())
+    found = board.find_words()
+    # C-A-R-T is a path through the 2x2 block, every cell touches every other
+    assert "CART" in found
+    assert found["CART"] == [0b1111]
+    assert "STAR" not in found
+
+
+def test_find_words_does_not_reuse_cells():
+    board = StrandsBoard(["STA", "XXR"], trie())
+    assert "STAR" in board.find_words()
+    assert "TSAR" not in board.find_words()
+
+
+def test_tile_covers_every_cell_once():
+    board = StrandsBoard(["CART", "STAR"], trie())
+    solution = next(board.tile())
+    masks = [mask for _, mask in solution]
+    assert sum(masks) == board.full_mask
+    assert all(not a & b for i, a in enumerate(masks) for b in masks[i + 1:])
+
+
+def test_spangram_touches_opposite_sides():
+    board = StrandsBoard(["CART", "STAR"], trie())
+    assert board.is_spangram(0b00001111)  # whole top row, left to right
+    assert not board.is_spangram(0b00000011)
+
+
+def test_rejects_ragged_grid():
+    with pytest.raises(ValueError):
+        StrandsBoard(["ABC", "AB"], trie())
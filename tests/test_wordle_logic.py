@@ -0,0 +1,28 @@
+from games.wordle import logic
+
+
+def test_load_words_is_cached_per_path(tmp_path):
+    extra = tmp_path / "words.txt"
+    extra.write_text("cabin\n\nbloke\n")
+    assert logic.load_words(extra) == ["CABIN", "BLOKE"]
+    assert logic.load_words(extra) is logic.load_words(extra)
+    assert logic.load_words() is not logic.load_words(extra)
+
+
+def test_suggest_caches_only_the_top_candidates():
+    suggestion, remaining, candidates = logic.suggest(logic.new_constraints())
+    assert remaining == len(logic.load_words())
+    assert len(candidates) == logic.TOP_CANDIDATES
+    assert suggestion in logic.load_words()
+
+
+def test_suggest_is_order_independent():
+    a, b = logic.new_constraints(), logic.new_constraints()
+    for letter, col, status in [("T", 0, "absent"), ("A", 1, "present"), ("S", 4, "correct")]:
+        logic.apply_status(a, letter, col, status)
+    for letter, col, status in [("S", 4, "correct"), ("A", 1, "present"), ("T", 0, "absent")]:
+        logic.apply_status(b, letter, col, status)
+    assert logic.suggest(a) is logic.suggest(b)
+    suggestion, remaining, candidates = logic.suggest(a)
+    assert 0 < remaining < len(logic.load_words())
+    assert all(w[4] == "S" and "A" in w and "T" not in w for w in candidates)